@@ -1,7 +1,8 @@
+import asyncio
 import logging
 import sys
-from functools import lru_cache
-from typing import Any, Tuple
+import threading
+from typing import Any, Coroutine, Optional, Tuple, TypeVar
 
 sys.path.insert(0, "/opt/airflow")
 
@@ -13,14 +14,58 @@ from src.services.pdf_parser.factory import make_pdf_parser_service
 
 logger = logging.getLogger(__name__)
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional
+    uvloop = None
+
+T = TypeVar("T")
+
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on an event loop that persists for the worker process.
+
+    Unlike ``asyncio.run``, the loop is not torn down after each call, so
+    loop setup is paid once per worker and loop-bound resources created by the
+    cached services stay usable across task invocations. The loop is a uvloop
+    loop when uvloop is installed; the process-wide loop policy is left alone,
+    since the scheduler also imports this module while parsing DAGs.
+
+    :param coro: Coroutine to run
+    :returns: The coroutine's result
+    """
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        asyncio.set_event_loop(_event_loop)
+    return _event_loop.run_until_complete(coro)
+
+
+_services: Optional[Tuple[Any, Any, Any, Any, Any]] = None
+_services_lock = threading.Lock()
+
 
-@lru_cache(maxsize=1)
 def get_cached_services() -> Tuple[Any, Any, Any, Any, Any]:
-    """Get cached service instances using lru_cache for automatic memoization.
+    """Get service instances, initializing them once per worker process.
+
+    Initialization is guarded by a lock so concurrent callers in the same
+    process never build the services (and load Docling models) twice.
 
     :returns: Tuple of (arxiv_client, pdf_parser, database, metadata_fetcher, opensearch_client)
     """
-    logger.info("Initializing services (cached with lru_cache)")
+    global _services
+    if _services is None:
+        with _services_lock:
+            if _services is None:
+                _services = _init_services()
+    return _services
+
+
+def _init_services() -> Tuple[Any, Any, Any, Any, Any]:
+    """Build the services shared by the ingestion tasks."""
+    logger.info("Initializing services (once per worker process)")
 
     # Initialize core services
     arxiv_client = make_arxiv_client()
@@ -31,5 +76,5 @@ def get_cached_services() -> Tuple[Any, Any, Any, Any, Any]:
     # Create metadata fetcher with dependencies
     metadata_fetcher = make_metadata_fetcher(arxiv_client, pdf_parser)
 
-    logger.info("All services initialized and cached with lru_cache")
+    logger.info("All services initialized and cached")
     return arxiv_client, pdf_parser, database, metadata_fetcher, opensearch_client
@@ -1,23 +1,35 @@
-import asyncio
 import logging
+import os
 from datetime import datetime, timedelta
 from typing import Optional
 
-from .common import get_cached_services
+from .common import get_cached_services, run_async
 
 logger = logging.getLogger(__name__)
 
+# Counters from the ingestion pipeline that are passed to downstream tasks via XCom
+FETCH_RESULT_KEYS = ("papers_fetched", "pdfs_downloaded", "pdfs_parsed", "papers_stored", "processing_time")
+
 
 async def run_paper_ingestion_pipeline(
     target_date: str,
     process_pdfs: bool = True,
+    parse_workers: Optional[int] = None,
 ) -> dict:
     """Async wrapper for the paper ingestion pipeline.
 
     :param target_date: Date to fetch papers for (YYYYMMDD format)
     :param process_pdfs: Whether to download and process PDFs
+    :param parse_workers: Number of worker processes used for PDF parsing; defaults to
+        PDF_PARSER__PARSE_WORKERS, capped at the CPU count
     :returns: Dictionary with ingestion statistics
     """
+    if parse_workers is None:
+        # common.py puts the project on sys.path, so src is only importable after it
+        from src.config import get_settings
+
+        parse_workers = min(get_settings().pdf_parser.parse_workers, os.cpu_count() or 1)
+
     arxiv_client, _, database, metadata_fetcher, _ = get_cached_services()
 
     max_results = arxiv_client.max_results
@@ -31,6 +43,7 @@ async def run_paper_ingestion_pipeline(
             process_pdfs=process_pdfs,
             store_to_db=True,
             db_session=session,
+            parse_workers=parse_workers,
         )
 
 
@@ -48,16 +61,15 @@ def fetch_daily_papers(**context):
     logger.info("Starting daily paper fetching task")
 
     execution_date = context.get("execution_date")
-    if execution_date:
-        target_dt = execution_date - timedelta(days=1)
-        target_date = target_dt.strftime("%Y%m%d")
-    else:
-        yesterday = datetime.now() - timedelta(days=1)
-        target_date = yesterday.strftime("%Y%m%d")
+    if isinstance(execution_date, str):
+        execution_date = datetime.fromisoformat(execution_date)
+
+    target_dt = (execution_date or datetime.now()) - timedelta(days=1)
+    target_date = f"{target_dt.year:04d}{target_dt.month:02d}{target_dt.day:02d}"
 
     logger.info(f"Fetching papers for date: {target_date}")
 
-    results = asyncio.run(
+    results = run_async(
         run_paper_ingestion_pipeline(
             target_date=target_date,
             process_pdfs=True,
@@ -66,9 +78,18 @@ def fetch_daily_papers(**context):
 
     logger.info(f"Daily fetch complete: {results['papers_fetched']} papers for {target_date}")
 
-    results["date"] = target_date
+    # Keep XCom payloads small: only counters travel through the metadata DB,
+    # the full error list stays in the task log.
+    errors = results.get("errors", [])
+    for error in errors:
+        logger.warning(f"Ingestion error: {error}")
+
+    fetch_results = {key: results.get(key, 0) for key in FETCH_RESULT_KEYS}
+    fetch_results["errors_count"] = len(errors)
+    fetch_results["date"] = target_date
+
     ti = context.get("ti")
     if ti:
-        ti.xcom_push(key="fetch_results", value=results)
+        ti.xcom_push(key="fetch_results", value=fetch_results)
 
-    return results
+    return fetch_results
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 
@@ -6,8 +5,13 @@ from src.db.factory import make_database
 from src.services.indexing.factory import make_hybrid_indexing_service
 from src.services.opensearch.factory import make_opensearch_client_fresh
 
+from .common import run_async
+
 logger = logging.getLogger(__name__)
 
+# Number of papers fetched from PostgreSQL and indexed per partition
+INDEX_PARTITION_SIZE = 200
+
 
 async def _index_papers_with_chunks(papers):
     """Async helper to index papers with chunking and embeddings."""
@@ -55,24 +59,55 @@ def index_papers_hybrid(**context):
             fetch_results = ti.xcom_pull(task_ids="fetch_daily_papers", key="fetch_results")
 
         with database.get_session() as session:
+            from sqlalchemy import desc, select
             from src.models.paper import Paper
 
-            if fetch_results and fetch_results.get("papers_stored", 0) > 0:
-                from sqlalchemy import desc
+            # Project only the columns the indexer needs and read them straight off
+            # the row mappings, skipping ORM hydration of full Paper objects.
+            query = select(
+                Paper.id,
+                Paper.arxiv_id,
+                Paper.title,
+                Paper.authors,
+                Paper.abstract,
+                Paper.categories,
+                Paper.published_date,
+                Paper.raw_text,
+                Paper.sections,
+            )
 
-                papers = session.query(Paper).order_by(desc(Paper.created_at)).limit(fetch_results["papers_stored"]).all()
+            papers_stored = int((fetch_results or {}).get("papers_stored") or 0)
+            if papers_stored > 0:
+                # LIMIT is sent as a bound parameter so the plan is reused across runs
+                query = query.order_by(desc(Paper.created_at)).limit(papers_stored)
             else:
-                cutoff_date = datetime.now(timezone.utc) - timedelta(days=1)
-                papers = session.query(Paper).filter(Paper.created_at >= cutoff_date).all()
-
-            if not papers:
+                # created_at is a naive UTC timestamp column; comparing it with a naive
+                # cutoff keeps the predicate a plain range scan instead of casting every
+                # row to timestamptz.
+                cutoff_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=1)
+                query = query.filter(Paper.created_at >= cutoff_date)
+
+            # Stream rows through a server-side cursor and index them partition by
+            # partition so only INDEX_PARTITION_SIZE raw_text blobs are held at once.
+            result = session.execute(query, execution_options={"stream_results": True, "yield_per": INDEX_PARTITION_SIZE})
+
+            stats = None
+            for partition in result.partitions():
+                papers = [{**row._mapping, "id": str(row.id)} for row in partition]
+
+                logger.info(f"Indexing {len(papers)} papers for hybrid search")
+
+                partition_stats = run_async(_index_papers_with_chunks(papers))
+                if stats is None:
+                    stats = partition_stats
+                else:
+                    for key, value in partition_stats.items():
+                        stats[key] += value
+
+            if stats is None:
                 logger.info("No papers to index for hybrid search")
                 return {"papers_indexed": 0, "chunks_created": 0}
 
-            logger.info(f"Indexing {len(papers)} papers for hybrid search")
-
-            stats = asyncio.run(_index_papers_with_chunks(papers))
-
             logger.info(
                 f"Hybrid indexing complete: {stats['papers_processed']} papers, "
                 f"{stats['total_chunks_created']} chunks created, "
@@ -96,19 +131,23 @@ def verify_hybrid_index(**context):
 
         stats = opensearch_client.client.indices.stats(index=opensearch_client.index_name)
 
-        count = opensearch_client.client.count(index=opensearch_client.index_name)
-
-        paper_count_query = {"aggs": {"unique_papers": {"cardinality": {"field": "arxiv_id"}}}, "size": 0}
+        # One search returns both the exact chunk count and the unique paper count
+        paper_count_query = {
+            "aggs": {"unique_papers": {"cardinality": {"field": "arxiv_id"}}},
+            "size": 0,
+            "track_total_hits": True,
+        }
 
         paper_count_response = opensearch_client.client.search(index=opensearch_client.index_name, body=paper_count_query)
 
+        total_chunks = paper_count_response["hits"]["total"]["value"]
         unique_papers = paper_count_response["aggregations"]["unique_papers"]["value"]
 
         result = {
             "index_name": opensearch_client.index_name,
-            "total_chunks": count["count"],
+            "total_chunks": total_chunks,
             "unique_papers": unique_papers,
-            "avg_chunks_per_paper": (count["count"] / unique_papers if unique_papers > 0 else 0),
+            "avg_chunks_per_paper": (total_chunks / unique_papers if unique_papers > 0 else 0),
             "index_size_mb": stats["indices"][opensearch_client.index_name]["total"]["store"]["size_in_bytes"] / (1024 * 1024),
         }
 
@@ -27,6 +27,7 @@ def generate_daily_report(**context):
         "fetch_statistics": {
             "papers_fetched": fetch_stats.get("papers_fetched", 0),
             "papers_stored": fetch_stats.get("papers_stored", 0),
+            "errors_count": fetch_stats.get("errors_count", 0),
             "target_date": fetch_stats.get("date", "unknown"),
         },
         "indexing_statistics": {
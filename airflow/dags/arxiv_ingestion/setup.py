@@ -17,6 +17,11 @@ def setup_environment():
     try:
         arxiv_client, _pdf_parser, database, _metadata_fetcher, opensearch_client = get_cached_services()
 
+        # Services are cached per worker process; skip re-verification once the index is known to be ready
+        if opensearch_client._index_ready:
+            logger.info("Environment already set up in this worker, skipping checks")
+            return {"status": "success", "message": "Environment already set up"}
+
         with database.get_session() as session:
             session.execute(text("SELECT 1"))
             logger.info("Database connection verified")
@@ -0,0 +1,23 @@
+"""
+Add created_at index for the daily indexing query
+
+The Airflow indexing task selects recently created papers either by a
+created_at range or by ORDER BY created_at DESC LIMIT n. A btree index
+serves both as an index range scan instead of a full table scan.
+"""
+
+from alembic import op
+
+# --- Alembic identifiers ---
+revision = "0004_add_papers_created_at_index"
+down_revision = "3d4f5a6b7c8e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_papers_created_at", "papers", ["created_at"])
+
+
+def downgrade():
+    op.drop_index("ix_papers_created_at", table_name="papers")
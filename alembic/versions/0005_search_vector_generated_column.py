@@ -0,0 +1,83 @@
+"""
+Replace the full text search trigger with a generated column
+
+The plpgsql trigger recomputed search_vector on every INSERT/UPDATE of
+papers. A STORED generated column evaluates the same expression natively
+without firing a trigger per row.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# --- Alembic identifiers ---
+revision = "0005_search_vector_generated"
+down_revision = "0004_add_papers_created_at_index"
+branch_labels = None
+depends_on = None
+
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(abstract, '')), 'B')"
+)
+
+
+def upgrade():
+    # --- Drop trigger-based maintenance ---
+    op.execute("DROP TRIGGER IF EXISTS tsvectorupdate ON papers;")
+    op.execute("DROP FUNCTION IF EXISTS papers_search_vector_update;")
+
+    # --- Recreate column as generated (drops the dependent GIN index) ---
+    op.drop_index("ix_papers_search_vector", table_name="papers")
+    op.drop_column("papers", "search_vector")
+    op.add_column(
+        "papers",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR,
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        ),
+    )
+
+    op.create_index(
+        "ix_papers_search_vector",
+        "papers",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade():
+    op.drop_index("ix_papers_search_vector", table_name="papers")
+    op.drop_column("papers", "search_vector")
+    op.add_column(
+        "papers",
+        sa.Column("search_vector", postgresql.TSVECTOR),
+    )
+
+    op.execute("""
+    CREATE FUNCTION papers_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+      NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NEW.abstract, '')), 'B');
+      RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER tsvectorupdate
+    BEFORE INSERT OR UPDATE ON papers
+    FOR EACH ROW EXECUTE FUNCTION papers_search_vector_update();
+    """)
+
+    op.execute(f"UPDATE papers SET search_vector = {SEARCH_VECTOR_EXPRESSION};")
+
+    op.create_index(
+        "ix_papers_search_vector",
+        "papers",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
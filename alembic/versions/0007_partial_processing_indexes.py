@@ -0,0 +1,44 @@
+"""
+Add partial indexes for the PDF processing listing queries
+
+get_papers_with_raw_text, get_processed_papers and get_unprocessed_papers
+each filter on a processing state and page through a date ordering.
+Partial indexes on just the matching rows let Postgres walk the index in
+order instead of scanning and sorting the table (raw_text rows are large).
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# --- Alembic identifiers ---
+revision = "0007_partial_processing_indexes"
+down_revision = "0006_raw_text_lz4_compression"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_papers_raw_text_present",
+        "papers",
+        [sa.text("pdf_processing_date DESC")],
+        postgresql_where=sa.text("raw_text IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_papers_processed",
+        "papers",
+        [sa.text("pdf_processing_date DESC")],
+        postgresql_where=sa.text("pdf_processed = true"),
+    )
+    op.create_index(
+        "ix_papers_unprocessed",
+        "papers",
+        [sa.text("published_date DESC")],
+        postgresql_where=sa.text("pdf_processed = false"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_papers_unprocessed", table_name="papers")
+    op.drop_index("ix_papers_processed", table_name="papers")
+    op.drop_index("ix_papers_raw_text_present", table_name="papers")
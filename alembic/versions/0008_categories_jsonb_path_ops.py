@@ -0,0 +1,40 @@
+"""
+Rebuild the categories GIN index with jsonb_path_ops
+
+Category search only ever uses containment (categories @> '["cs.AI"]').
+jsonb_path_ops indexes just the value paths needed for @>, giving a
+smaller index with cheaper lookups than the default jsonb_ops, which also
+indexes every key for the ?/?|/?& operators the app never uses.
+"""
+
+from alembic import op
+
+# --- Alembic identifiers ---
+revision = "0008_categories_jsonb_path_ops"
+down_revision = "0007_partial_processing_indexes"
+branch_labels = None
+depends_on = None
+
+
+def _rebuild_categories_index(**create_kwargs):
+    # CONCURRENTLY cannot run inside a transaction. Building the replacement under a temporary
+    # name first means category search keeps an index throughout; writes are never blocked.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_papers_categories_new",
+            "papers",
+            ["categories"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            **create_kwargs,
+        )
+        op.drop_index("ix_papers_categories", table_name="papers", postgresql_concurrently=True)
+        op.execute("ALTER INDEX ix_papers_categories_new RENAME TO ix_papers_categories")
+
+
+def upgrade():
+    _rebuild_categories_index(postgresql_ops={"categories": "jsonb_path_ops"})
+
+
+def downgrade():
+    _rebuild_categories_index()
@@ -24,4 +24,5 @@ echo "Running migrations..."
 alembic upgrade head
 
 echo "Starting API..."
-exec uvicorn src.main:app --host 0.0.0.0 --port 8000 --workers 4
+exec uvicorn src.main:app --host 0.0.0.0 --port 8000 \
+    --workers "${WEB_CONCURRENCY:-4}" --loop uvloop --http httptools
@@ -1,12 +1,33 @@
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Optional
 
 import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api/v1")
 
+# Shared session so repeated calls reuse pooled keep-alive connections
+# instead of opening a new TCP (and TLS) connection per request.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
+# Background work the UI should not wait on (bookmark writes, flashcard refreshes)
+_BACKGROUND = ThreadPoolExecutor(max_workers=2)
+
+
+@st.cache_data(ttl=300, show_spinner=False, max_entries=128)
 def search_papers(
     query: Optional[str] = None,
     categories: Optional[List[str]] = None,
@@ -29,7 +50,7 @@ def search_papers(
     if published_before:
         params["published_before"] = published_before.isoformat()
 
-    response = requests.get(
+    response = _SESSION.get(
         f"{API_BASE_URL}/papers/search",
         params=params,
         timeout=10,
@@ -38,8 +59,9 @@ def search_papers(
     return response.json()
 
 
+@st.cache_data(ttl=300, show_spinner=False, max_entries=128)
 def ask_question(payload: dict):
-    response = requests.post(
+    response = _SESSION.post(
         f"{API_BASE_URL}/ask",
         json=payload,
         timeout=60,
@@ -48,8 +70,9 @@ def ask_question(payload: dict):
     return response.json()
 
 
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=256)
 def get_mindmap(arxiv_id: str):
-    response = requests.get(
+    response = _SESSION.get(
         f"{API_BASE_URL}/visualization/{arxiv_id}/mindmap",
         timeout=120,  # generation can take 10-30s on first request
     )
@@ -57,15 +80,91 @@ def get_mindmap(arxiv_id: str):
     return response.json()
 
 
+def regenerate_mindmap(arxiv_id: str):
+    """Drop the cached mind map (client and server side) and generate a new one."""
+    response = _SESSION.delete(
+        f"{API_BASE_URL}/visualization/{arxiv_id}/mindmap",
+        timeout=10,
+    )
+    response.raise_for_status()
+    # Only this paper's entry; other papers' mind maps stay cached
+    get_mindmap.clear(arxiv_id)
+    return get_mindmap(arxiv_id)
+
+
 # ============================================================================
 # Flashcard API Functions
 # ============================================================================
 
 
+def _format_timestamp(ts: Optional[str]) -> Optional[str]:
+    if not ts:
+        return None
+    return datetime.fromisoformat(ts.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M UTC")
+
+
+def _prepare_flashcards(data: dict) -> dict:
+    """Attach display-ready fields once at fetch time so pages never re-derive them per rerun."""
+    for card in data.get("flashcards", []):
+        card["_generated_str"] = _format_timestamp(card.get("generated_at"))
+
+    meta = data.setdefault("meta", {})
+    meta["_generated_str"] = _format_timestamp(meta.get("generated_at"))
+    meta["_topics"] = sorted({card["topic"] for card in data.get("flashcards", []) if card.get("topic")})
+    return data
+
+
+# Last (ETag, prepared body) per (arxiv_id, num_cards) for conditional GETs, least recently used evicted first
+_FLASHCARD_ETAGS: OrderedDict = OrderedDict()
+_FLASHCARD_ETAGS_MAX = 128
+_FLASHCARD_ETAGS_LOCK = threading.Lock()
+
+
+def _get_flashcards_uncached(arxiv_id: str, num_cards: int, force_refresh: bool):
+    params = {
+        "num_cards": num_cards,
+        "force_refresh": force_refresh,
+    }
+    key = (arxiv_id, num_cards)
+    with _FLASHCARD_ETAGS_LOCK:
+        known = _FLASHCARD_ETAGS.get(key)
+        if known:
+            _FLASHCARD_ETAGS.move_to_end(key)
+    headers = {"If-None-Match": known[0]} if known and not force_refresh else {}
+
+    response = _SESSION.get(
+        f"{API_BASE_URL}/visualization/{arxiv_id}/flashcards",
+        params=params,
+        headers=headers,
+        timeout=120,  # LLM generation can take time
+    )
+    if response.status_code == 304 and known:
+        return known[1]
+    response.raise_for_status()
+
+    data = _prepare_flashcards(response.json())
+    etag = response.headers.get("ETag")
+    if etag:
+        with _FLASHCARD_ETAGS_LOCK:
+            _FLASHCARD_ETAGS[key] = (etag, data)
+            _FLASHCARD_ETAGS.move_to_end(key)
+            while len(_FLASHCARD_ETAGS) > _FLASHCARD_ETAGS_MAX:
+                _FLASHCARD_ETAGS.popitem(last=False)
+    return data
+
+
+@st.cache_data(ttl=300, show_spinner=False, max_entries=128)
+def _get_flashcards_cached(arxiv_id: str, num_cards: int):
+    return _get_flashcards_uncached(arxiv_id, num_cards, force_refresh=False)
+
+
 def get_flashcards(arxiv_id: str, num_cards: int = 15, force_refresh: bool = False):
     """
     Get or generate flashcards for a paper.
 
+    Responses are cached client-side for 5 minutes per (arxiv_id, num_cards);
+    force_refresh bypasses and resets that entry.
+
     Args:
         arxiv_id: ArXiv ID of the paper
         num_cards: Number of flashcards to generate (5-50)
@@ -74,23 +173,26 @@ def get_flashcards(arxiv_id: str, num_cards: int = 15, force_refresh: bool = Fal
     Returns:
         Flashcard set with all flashcards and metadata
     """
-    params = {
-        "num_cards": num_cards,
-        "force_refresh": force_refresh,
-    }
+    if force_refresh:
+        _get_flashcards_cached.clear(arxiv_id, num_cards)
+        return _get_flashcards_uncached(arxiv_id, num_cards, force_refresh=True)
 
-    response = requests.get(
-        f"{API_BASE_URL}/visualization/{arxiv_id}/flashcards",
-        params=params,
-        timeout=120,  # LLM generation can take time
-    )
-    response.raise_for_status()
-    return response.json()
+    return _get_flashcards_cached(arxiv_id, num_cards)
+
+
+def clear_flashcards_cache():
+    """Drop all client-side cached flashcard responses."""
+    _get_flashcards_cached.clear()
+
+
+def refresh_flashcards_async(arxiv_id: str, num_cards: int = 15) -> Future:
+    """Fetch flashcards on a background thread; the caller polls the returned future."""
+    return _BACKGROUND.submit(_get_flashcards_uncached, arxiv_id, num_cards, False)
 
 
 def get_flashcard_status(arxiv_id: str):
     """Check if flashcards exist and are cached."""
-    response = requests.get(
+    response = _SESSION.get(
         f"{API_BASE_URL}/visualization/{arxiv_id}/flashcards/status",
         timeout=10,
     )
@@ -102,10 +204,58 @@ def regenerate_flashcards(arxiv_id: str, num_cards: int = 15):
     """Force regenerate flashcards for a paper."""
     params = {"num_cards": num_cards}
 
-    response = requests.post(
+    response = _SESSION.post(
         f"{API_BASE_URL}/visualization/{arxiv_id}/flashcards/regenerate",
         params=params,
         timeout=120,
     )
     response.raise_for_status()
-    return response.json()
+    _get_flashcards_cached.clear(arxiv_id, num_cards)
+    return _prepare_flashcards(response.json())
+
+
+BOOKMARK_SESSION_HEADER = "X-Bookmark-Session"
+
+
+def create_bookmark_session() -> str:
+    """Ask the backend for a new bookmark session id."""
+    response = _SESSION.post(f"{API_BASE_URL}/bookmarks/session", timeout=5)
+    response.raise_for_status()
+    return response.json()["session_id"]
+
+
+def get_bookmarks(session_id: str) -> Optional[list]:
+    """Bookmarked paper summaries, or None if the session is unknown or expired."""
+    response = _SESSION.get(
+        f"{API_BASE_URL}/bookmarks",
+        headers={BOOKMARK_SESSION_HEADER: session_id},
+        timeout=5,
+    )
+    if response.status_code in (401, 422):
+        return None
+    response.raise_for_status()
+    return response.json()["bookmarks"]
+
+
+class BookmarkWriteError(Exception):
+    """A bookmark write the backend rejected; ``status_code`` is the HTTP status."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"Bookmark write failed with HTTP {status_code}")
+        self.status_code = status_code
+
+
+def _write_bookmark(session_id: str, arxiv_id: str, bookmarked: bool):
+    url = f"{API_BASE_URL}/bookmarks/{arxiv_id}"
+    headers = {BOOKMARK_SESSION_HEADER: session_id}
+    if bookmarked:
+        response = _SESSION.put(url, headers=headers, timeout=5)
+    else:
+        response = _SESSION.delete(url, headers=headers, timeout=5)
+    if not response.ok:
+        raise BookmarkWriteError(response.status_code)
+
+
+def save_bookmark(session_id: str, arxiv_id: str, bookmarked: bool) -> Future:
+    """Persist a bookmark toggle in the background; the caller checks the returned future."""
+    return _BACKGROUND.submit(_write_bookmark, session_id, arxiv_id, bookmarked)
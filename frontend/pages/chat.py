@@ -1,13 +1,20 @@
+from collections import deque
+from itertools import islice
+
 import streamlit as st
 from api import ask_question
 
+# Messages kept in the session and rendered inline on each rerun
+MAX_HISTORY = 200
+VISIBLE_MESSAGES = 20
+
 st.title("💬 Research Assistant")
 st.caption("Ask questions over your paper collection using Retrieval-Augmented Generation")
 
 # ----------------------
 # Session state
 # ----------------------
-st.session_state.setdefault("chat_history", [])
+st.session_state.setdefault("chat_history", deque(maxlen=MAX_HISTORY))
 
 # ----------------------
 # Sidebar – RAG controls
@@ -49,7 +56,7 @@ with st.sidebar:
 # ----------------------
 # Render chat history
 # ----------------------
-for msg in st.session_state["chat_history"]:
+def render_message(msg):
     if msg["role"] == "user":
         with st.chat_message("user"):
             st.write(msg["content"])
@@ -67,6 +74,19 @@ for msg in st.session_state["chat_history"]:
                     for src in msg["sources"]:
                         st.markdown(f"- [{src}]({src})")
 
+
+history = st.session_state["chat_history"]
+hidden = max(0, len(history) - VISIBLE_MESSAGES)
+
+# Older turns are tucked into a collapsed expander so only the recent ones are drawn inline
+if hidden:
+    with st.expander(f"Earlier ({hidden} messages)"):
+        for msg in islice(history, 0, hidden):
+            render_message(msg)
+
+for msg in islice(history, hidden, None):
+    render_message(msg)
+
 # ----------------------
 # Chat input
 # ----------------------
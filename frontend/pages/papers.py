@@ -1,6 +1,49 @@
+import base64
+import gzip
+import html
+import logging
+import time
+
+import orjson
 import streamlit as st
 
-from api import get_flashcards, get_mindmap, search_papers
+from api import (
+    BookmarkWriteError,
+    clear_flashcards_cache,
+    create_bookmark_session,
+    get_bookmarks,
+    get_flashcards,
+    get_mindmap,
+    refresh_flashcards_async,
+    regenerate_mindmap,
+    save_bookmark,
+    search_papers,
+)
+
+logger = logging.getLogger(__name__)
+
+# Category codes offered in the search filters
+CODE_TO_NAME = {
+    "cs.AI": "Artificial Intelligence",
+    "cs.CV": "Computer Vision",
+    "cs.CL": "Natural Language Processing",
+    "cs.LG": "Machine Learning",
+    "cs.RO": "Robotics",
+    "cs.SY": "Systems",
+}
+
+DIFFICULTY_EMOJI = {"easy": "🟢", "medium": "🟡", "hard": "🔴"}
+
+# Paper card markup; every field is html-escaped before formatting
+_CARD_TMPL = (
+    '<div class="paper-card">'
+    '<div class="paper-title">{title}</div>'
+    '<div class="paper-authors">{authors}</div>'
+    '<div class="paper-abstract">{abstract}</div>'
+    '<div class="paper-meta">{status}</div>'
+    '<div class="paper-tags">{tags}</div>'
+    "</div>"
+)
 
 # ======================
 # Page setup & state
@@ -11,6 +54,7 @@ st.session_state.setdefault("papers", [])
 st.session_state.setdefault("active_pdf", None)
 st.session_state.setdefault("active_pdf_title", None)
 st.session_state.setdefault("bookmarks", set())
+st.session_state.setdefault("bookmarked_papers", {})
 st.session_state.setdefault("active_mindmap", None)
 st.session_state.setdefault("active_mindmap_title", None)
 st.session_state.setdefault("active_flashcards", None)
@@ -18,13 +62,35 @@ st.session_state.setdefault("active_flashcards_title", None)
 st.session_state.setdefault("current_card_index", 0)
 st.session_state.setdefault("show_answer", False)
 st.session_state.setdefault("studied_cards", set())
+st.session_state.setdefault("active_flashcards_arxiv_id", None)
+st.session_state.setdefault("_flashcards_by_paper", {})
+st.session_state.setdefault("_flashcards_refresh", None)
+st.session_state.setdefault("_bookmark_writes", [])
+
+# Bookmarks live in the backend under a server-issued session id kept in the URL,
+# and are loaded once per session; toggles update the local copy and write through.
+if "bookmarks_loaded" not in st.session_state:
+    try:
+        saved_papers = get_bookmarks(st.query_params["bsid"]) if "bsid" in st.query_params else None
+        if saved_papers is None:
+            st.query_params["bsid"] = create_bookmark_session()
+            saved_papers = []
+        for saved in saved_papers:
+            st.session_state["bookmarks"].add(str(saved["id"]))
+            st.session_state["bookmarked_papers"][str(saved["id"])] = saved
+        st.session_state["bookmark_session"] = st.query_params["bsid"]
+    except Exception as e:
+        # Bookmarks are best-effort; the page works without them
+        logger.warning("Could not load bookmarks, continuing without a bookmark session: %s", e)
+    st.session_state["bookmarks_loaded"] = True
 
 
 # ======================
 # Dark mode styling
 # ======================
-st.markdown(
-    """
+# Streamlit drops elements that are not re-emitted on a rerun, so the style
+# block is written on every run rather than once per session.
+_CARD_CSS = """
 <style>
 /* Paper card - dark mode, clean design */
 .paper-card {
@@ -114,6 +180,13 @@ st.markdown(
     text-overflow: ellipsis;
 }
 
+/* Two-column card grid, rendered as a single markdown element */
+.paper-grid {
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    column-gap: 1.5rem;
+}
+
 /* Flashcard styles - dark mode */
 .flashcard-front, .flashcard-back {
     position: relative;
@@ -160,6 +233,10 @@ st.markdown(
 
 /* Responsive fixes */
 @media (max-width: 768px) {
+    .paper-grid {
+        grid-template-columns: 1fr;
+    }
+
     .paper-card {
         padding: 1rem;
     }
@@ -183,9 +260,9 @@ st.markdown(
     }
 }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+
+st.markdown(_CARD_CSS, unsafe_allow_html=True)
 
 
 # ======================
@@ -216,7 +293,7 @@ def render_flashcards(flashcards_data: dict):
             st.caption(f"📚 **{current_card['topic']}**")
     with col2:
         if current_card.get("difficulty"):
-            difficulty_emoji = {"easy": "🟢", "medium": "🟡", "hard": "🔴"}.get(current_card["difficulty"], "⚪")
+            difficulty_emoji = DIFFICULTY_EMOJI.get(current_card["difficulty"], "⚪")
             st.caption(f"{difficulty_emoji} **{current_card['difficulty'].title()}**")
     with col3:
         studied_count = len(st.session_state["studied_cards"])
@@ -277,7 +354,7 @@ def render_flashcards(flashcards_data: dict):
 
     # Additional controls
     st.markdown("<br>", unsafe_allow_html=True)
-    control_col1, control_col2, control_col3 = st.columns(3)
+    control_col1, control_col2, control_col3, control_col4 = st.columns(4)
 
     with control_col1:
         if st.button("🔀 Shuffle", use_container_width=True):
@@ -298,32 +375,104 @@ def render_flashcards(flashcards_data: dict):
     with control_col3:
         # Filter options
         with st.popover("🎯 Filter"):
-            topics = list(set(fc.get("topic") for fc in flashcards if fc.get("topic")))
+            topics = flashcards_data.get("meta", {}).get("_topics", [])
             if topics:
                 selected_topic = st.selectbox("Filter by topic", ["All"] + topics)
                 if selected_topic != "All":
                     st.info(f"Filtering by: {selected_topic}")
 
+    with control_col4:
+        if st.button("🧹 Clear cache", use_container_width=True, help="Refetch flashcards on next open"):
+            clear_flashcards_cache()
+            st.toast("Flashcard cache cleared")
+
 
 # ======================
 # Mind map renderer
 # ======================
+MINDMAP_LAYOUT_HEIGHT = 700  # svg height minus top/bottom margins
+MINDMAP_DEPTH_SPACING = 220
+MINDMAP_INITIAL_DEPTH = 2  # nodes at this depth and below start collapsed
+# Pinned so the browser reuses one cached copy across every mind map iframe
+D3_SRC = "https://cdn.jsdelivr.net/npm/d3@7.9.0/dist/d3.min.js"
+
+MINDMAP_NODE_COLORS = {
+    "root": "#7c3aed",
+    "problem": "#dc2626",
+    "approach": "#2563eb",
+    "concept": "#0891b2",
+    "finding": "#16a34a",
+    "contribution": "#d97706",
+    "limitation": "#9f1239",
+}
+
+
+def _to_json(obj) -> str:
+    """Compact JSON for embedding in the mind map template."""
+    return orjson.dumps(obj).decode()
+
+
+MINDMAP_COLORS_JSON = _to_json(MINDMAP_NODE_COLORS)
+
+# Trees larger than this are shipped gzipped and inflated in the browser
+MINDMAP_COMPRESS_THRESHOLD = 16_000
+
+
+def _tree_js_source(tree_json: str) -> str:
+    """JS expression evaluating to the tree, gzip+base64 encoded when it is large."""
+    if len(tree_json) <= MINDMAP_COMPRESS_THRESHOLD:
+        return tree_json
+    blob = base64.b64encode(gzip.compress(tree_json.encode(), compresslevel=6)).decode()
+    return f'await inflateJson("{blob}")'
+
+
+def _layout_mindmap(node: dict, depth: int = 0, cursor: list | None = None) -> dict:
+    """Returns a copy of the tree with first-paint positions precomputed.
+
+    Only nodes visible on first paint get ``__px``/``__py``; leaves are spread
+    evenly and parents sit at the midpoint of their children, so the browser
+    can skip the D3 layout pass until the user toggles a node.
+    """
+    if cursor is None:
+        cursor = [0]
+
+    children = node.get("children") or []
+    out = {k: v for k, v in node.items() if k != "children"}
+    out["__collapsed"] = depth >= MINDMAP_INITIAL_DEPTH and bool(children)
+    out["__px"] = depth * MINDMAP_DEPTH_SPACING
+
+    if depth < MINDMAP_INITIAL_DEPTH and children:
+        out["children"] = [_layout_mindmap(child, depth + 1, cursor) for child in children]
+        out["__py"] = (out["children"][0]["__py"] + out["children"][-1]["__py"]) / 2
+    else:
+        out["children"] = [_strip_layout(child) for child in children]
+        out["__py"] = cursor[0]
+        cursor[0] += 1
+
+    if depth == 0:
+        _scale_layout(out, MINDMAP_LAYOUT_HEIGHT / max(cursor[0] - 1, 1), cursor[0])
+    return out
+
+
+def _strip_layout(node: dict) -> dict:
+    children = [_strip_layout(child) for child in node.get("children") or []]
+    return dict(node, children=children, __collapsed=bool(children))
+
+
+def _scale_layout(node: dict, step: float, leaves: int) -> None:
+    # A single visible leaf is centred, matching d3.tree()
+    node["__py"] = MINDMAP_LAYOUT_HEIGHT / 2 if leaves <= 1 else node["__py"] * step
+    if node["__collapsed"]:
+        return
+    for child in node["children"]:
+        if "__py" in child:
+            _scale_layout(child, step, leaves)
+
+
 def render_mindmap(mindmap: dict):
     """Renders the mind map as an interactive D3 collapsible tree."""
-    import json as _json
-
-    node_colors = {
-        "root": "#7c3aed",
-        "problem": "#dc2626",
-        "approach": "#2563eb",
-        "concept": "#0891b2",
-        "finding": "#16a34a",
-        "contribution": "#d97706",
-        "limitation": "#9f1239",
-    }
-
-    colors_json = _json.dumps(node_colors)
-    tree_json = _json.dumps(mindmap["root"])
+    colors_json = MINDMAP_COLORS_JSON
+    tree_source = _tree_js_source(_to_json(_layout_mindmap(mindmap["root"])))
 
     html = f"""
     <!DOCTYPE html>
@@ -408,9 +557,15 @@ def render_mindmap(mindmap: dict):
       </div>
       <svg id="tree"></svg>
 
-      <script src="https://cdn.jsdelivr.net/npm/d3@7"></script>
-      <script>
-      const RAW   = {tree_json};
+      <script src="{D3_SRC}" crossorigin="anonymous"></script>
+      <script type="module">
+      async function inflateJson(b64) {{
+        const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+        const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+        return JSON.parse(await new Response(stream).text());
+      }}
+
+      const RAW   = {tree_source};
       const COLORS = {colors_json};
 
       const W = document.getElementById('tree').clientWidth || 1100;
@@ -441,9 +596,9 @@ def render_mindmap(mindmap: dict):
       root.x0 = (H - MARGIN.top - MARGIN.bottom) / 2;
       root.y0 = 0;
 
-      // Collapse nodes beyond depth 1 initially
+      // Collapse nodes flagged by the server-side layout
       root.descendants().forEach(d => {{
-        if (d.depth > 1) {{
+        if (d.data.__collapsed) {{
           d._children = d.children;
           d.children = null;
         }}
@@ -453,14 +608,21 @@ def render_mindmap(mindmap: dict):
         .size([H - MARGIN.top - MARGIN.bottom, W - MARGIN.left - MARGIN.right]);
 
       let i = 0;
+      let firstPaint = RAW.__px !== undefined;
 
       function update(source) {{
-        treeLayout(root);
         const nodes = root.descendants();
         const links  = root.links();
 
-        // Normalize depth spacing
-        nodes.forEach(d => {{ d.y = d.depth * 220; }});
+        if (firstPaint) {{
+          // Positions were precomputed in Python; skip the layout pass once
+          nodes.forEach(d => {{ d.x = d.data.__py; d.y = d.data.__px; }});
+          firstPaint = false;
+        }} else {{
+          treeLayout(root);
+          // Normalize depth spacing
+          nodes.forEach(d => {{ d.y = d.depth * 220; }});
+        }}
 
         // --- Links ---
         const link = g.selectAll('.link').data(links, d => d.target.id);
@@ -573,6 +735,9 @@ def render_mindmap(mindmap: dict):
         );
       }}
 
+      // Module scope: expose the handlers used by the control buttons
+      Object.assign(window, {{ resetZoom, expandAll, collapseAll }});
+
       update(root);
       </script>
     </body>
@@ -584,7 +749,12 @@ def render_mindmap(mindmap: dict):
 # ======================
 # PDF preview
 # ======================
-if st.session_state["active_pdf"]:
+@st.fragment
+def render_pdf_preview():
+    """PDF viewer; closing it reruns only this fragment, not the whole page."""
+    if not st.session_state["active_pdf"]:
+        return
+
     with st.container(border=True):
         header_col, close_col = st.columns([8, 1])
 
@@ -595,7 +765,7 @@ if st.session_state["active_pdf"]:
             if st.button("❌ Close", key="close_pdf"):
                 st.session_state["active_pdf"] = None
                 st.session_state["active_pdf_title"] = None
-                st.rerun()
+                st.rerun(scope="fragment")
 
         st.components.v1.iframe(
             st.session_state["active_pdf"],
@@ -606,9 +776,38 @@ if st.session_state["active_pdf"]:
     st.markdown("---")
 
 
+render_pdf_preview()
+
+
 # ======================
 # Flashcard viewer
 # ======================
+FLASHCARDS_STALE_AFTER = 600  # seconds before a remembered set is treated as cold
+
+
+@st.fragment(run_every=1)
+def watch_flashcards_refresh():
+    """Polls the background flashcard refresh and swaps the result in when it lands."""
+    pending = st.session_state["_flashcards_refresh"]
+    if pending is None:
+        return
+
+    arxiv_id, future = pending
+    if not future.done():
+        st.caption("🔄 Refreshing…")
+        return
+
+    st.session_state["_flashcards_refresh"] = None
+    try:
+        flashcards = future.result()
+    except Exception:
+        return  # Keep showing the stale copy
+
+    st.session_state["_flashcards_by_paper"][arxiv_id] = {"t": time.time(), "val": flashcards}
+    if st.session_state["active_flashcards_arxiv_id"] == arxiv_id:
+        st.session_state["active_flashcards"] = flashcards
+        st.rerun()
+
 if st.session_state["active_flashcards"]:
     with st.container(border=True):
         header_col, close_col = st.columns([8, 1])
@@ -639,6 +838,10 @@ if st.session_state["active_flashcards"]:
                     st.caption("⚡ Cached")
                 else:
                     st.caption("🆕 Newly generated")
+                if meta.get("_generated_str"):
+                    st.caption(f"🕒 {meta['_generated_str']}")
+                if st.session_state["_flashcards_refresh"] is not None:
+                    watch_flashcards_refresh()
 
         st.markdown("---")
 
@@ -651,18 +854,32 @@ if st.session_state["active_flashcards"]:
 # ======================
 # Mind map preview
 # ======================
-if st.session_state["active_mindmap"]:
+@st.fragment
+def render_mindmap_preview():
+    """Mind map viewer; regenerate and close rerun only this fragment."""
+    if not st.session_state["active_mindmap"]:
+        return
+
     with st.container(border=True):
-        header_col, close_col = st.columns([8, 1])
+        header_col, regen_col, close_col = st.columns([7, 1, 1])
 
         with header_col:
             st.subheader(f"🧠 {st.session_state['active_mindmap_title']}")
 
+        with regen_col:
+            if st.button("↻ Regenerate", key="regen_mindmap"):
+                with st.spinner("Regenerating..."):
+                    try:
+                        st.session_state["active_mindmap"] = regenerate_mindmap(st.session_state["active_mindmap"]["arxiv_id"])
+                        st.rerun(scope="fragment")
+                    except Exception as e:
+                        st.error(f"Failed: {e}")
+
         with close_col:
             if st.button("❌ Close", key="close_mindmap"):
                 st.session_state["active_mindmap"] = None
                 st.session_state["active_mindmap_title"] = None
-                st.rerun()
+                st.rerun(scope="fragment")
 
         sections = st.session_state["active_mindmap"].get("sections_covered", [])
         if sections:
@@ -673,6 +890,9 @@ if st.session_state["active_mindmap"]:
     st.markdown("---")
 
 
+render_mindmap_preview()
+
+
 # ======================
 # Sidebar search
 # ======================
@@ -681,15 +901,6 @@ with st.sidebar.form("paper_search_form"):
 
     query = st.text_input("Search by title")
 
-    CODE_TO_NAME = {
-        "cs.AI": "Artificial Intelligence",
-        "cs.CV": "Computer Vision",
-        "cs.CL": "Natural Language Processing",
-        "cs.LG": "Machine Learning",
-        "cs.RO": "Robotics",
-        "cs.SY": "Systems",
-    }
-
     categories = st.multiselect(
         "Categories",
         options=list(CODE_TO_NAME.keys()),
@@ -710,15 +921,25 @@ with st.sidebar.form("paper_search_form"):
 # ======================
 # Fetch papers
 # ======================
+def cached_search(query, categories, pdf_processed, limit):
+    """Normalize the filters before calling search_papers.
+
+    search_papers is already memoized with st.cache_data, so this only makes
+    equivalent searches (blank query, the same categories in a different order)
+    share one cache entry there.
+    """
+    return search_papers(
+        query=query or None,
+        categories=sorted(categories) if categories else None,
+        pdf_processed=pdf_processed,
+        limit=limit,
+        offset=0,
+    )
+
+
 if submitted:
     try:
-        response = search_papers(
-            query=query or None,
-            categories=categories or None,
-            pdf_processed=pdf_processed,
-            limit=limit,
-            offset=0,
-        )
+        response = cached_search(query, categories, pdf_processed, limit)
         st.session_state["papers"] = response.get("papers", [])
     except Exception as e:
         st.error(f"Failed to load papers: {e}")
@@ -737,96 +958,180 @@ def render_cards(paper_list, context: str):
         st.info("No papers to show.")
         return
 
-    cols = st.columns(2)
-
-    for idx, paper in enumerate(paper_list):
-        col = cols[idx % 2]
-        paper_id = str(paper["id"])
-        arxiv_id = paper.get("arxiv_id") or paper_id
-        pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
-        is_bookmarked = paper_id in st.session_state["bookmarks"]
+    # Build every card up front and emit the whole grid as one element
+    html_parts = []
+    for paper in paper_list:
+        authors = paper.get("authors") or []
+        author_line = ", ".join(map(html.escape, authors[:3])) + ("..." if len(authors) > 3 else "") if authors else "No authors"
 
         # Truncate abstract for display
-        abstract = paper.get("abstract", "")
+        abstract = paper.get("abstract") or ""
         if len(abstract) > 250:
             abstract = abstract[:250] + "..."
 
-        with col:
-            st.markdown(
-                f"""
-<div class="paper-card">
-    <div class="paper-title">{paper["title"]}</div>
-    <div class="paper-authors">
-        {", ".join(paper.get("authors", [])[:3]) if paper.get("authors") else "No authors"}
-        {"..." if len(paper.get("authors", [])) > 3 else ""}
-    </div>
-    <div class="paper-abstract">
-        {abstract if abstract else "No abstract available"}
-    </div>
-    <div class="paper-meta">
-        {"✓ Processed" if paper.get("pdf_processed") else "⏳ Processing"}
-    </div>
-    <div class="paper-tags">
-        {" • ".join(paper.get("categories", [])[:4])}
-    </div>
-</div>
-""",
-                unsafe_allow_html=True,
+        html_parts.append(
+            _CARD_TMPL.format(
+                title=html.escape(paper["title"]),
+                authors=author_line,
+                abstract=html.escape(abstract) if abstract else "No abstract available",
+                status="✓ Processed" if paper.get("pdf_processed") else "⏳ Processing",
+                tags=" • ".join(map(html.escape, (paper.get("categories") or [])[:4])),
             )
+        )
 
-            # Action buttons - 4 buttons in responsive layout
-            action_cols = st.columns(4)
-
-            with action_cols[0]:
-                if st.button(
-                    "⭐" if is_bookmarked else "☆",
-                    key=f"bm_{context}_{paper_id}",
-                    use_container_width=True,
-                ):
-                    if is_bookmarked:
-                        st.session_state["bookmarks"].remove(paper_id)
-                    else:
-                        st.session_state["bookmarks"].add(paper_id)
-                    st.rerun()
+    st.markdown('<div class="paper-grid">' + "".join(html_parts) + "</div>", unsafe_allow_html=True)
 
-            with action_cols[1]:
-                if st.button("📄", key=f"open_{context}_{paper_id}", use_container_width=True, help="View PDF"):
-                    st.session_state["active_pdf"] = pdf_url
-                    st.session_state["active_pdf_title"] = paper["title"]
-                    st.rerun()
+    # One action bar for the list instead of four buttons per card
+    render_card_actions({str(paper["id"]): paper for paper in paper_list}, context)
 
-            with action_cols[2]:
-                if st.button("🧠", key=f"mm_{context}_{paper_id}", use_container_width=True, help="Mind Map"):
-                    with st.spinner("Generating..."):
-                        try:
-                            mindmap = get_mindmap(arxiv_id)
-                            st.session_state["active_mindmap"] = mindmap
-                            st.session_state["active_mindmap_title"] = paper["title"]
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed: {e}")
-
-            with action_cols[3]:
-                if st.button("📇", key=f"fc_{context}_{paper_id}", use_container_width=True, help="Flashcards"):
-                    with st.spinner("Generating..."):
-                        try:
-                            flashcards = get_flashcards(arxiv_id, num_cards=15)
-                            st.session_state["active_flashcards"] = flashcards
-                            st.session_state["active_flashcards_title"] = paper["title"]
-                            st.session_state["current_card_index"] = 0
-                            st.session_state["show_answer"] = False
-                            st.session_state["studied_cards"] = set()
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed: {e}")
+
+def _toggle_bookmark(paper_id: str, paper: dict):
+    bookmarked = paper_id not in st.session_state["bookmarks"]
+    if bookmarked:
+        st.session_state["bookmarks"].add(paper_id)
+        st.session_state["bookmarked_papers"][paper_id] = paper
+    else:
+        st.session_state["bookmarks"].remove(paper_id)
+        st.session_state["bookmarked_papers"].pop(paper_id, None)
+    # Without a backend session the bookmark only lasts for this browser session
+    if "bookmark_session" in st.session_state and paper.get("arxiv_id"):
+        future = save_bookmark(st.session_state["bookmark_session"], paper["arxiv_id"], bookmarked)
+        st.session_state["_bookmark_writes"].append((paper_id, paper, bookmarked, future))
+
+
+_BOOKMARK_WRITE_ERRORS = {
+    401: "Bookmark session expired; reload the page to start a new one",
+    409: "Bookmark limit reached; remove a bookmark first",
+}
+
+
+def _settle_bookmark_writes() -> bool:
+    """Roll back local toggles the backend rejected; True if any were rolled back."""
+    pending, rolled_back = [], False
+    for paper_id, paper, bookmarked, future in st.session_state["_bookmark_writes"]:
+        if not future.done():
+            pending.append((paper_id, paper, bookmarked, future))
+            continue
+        error = future.exception()
+        if error is None:
+            continue
+
+        logger.warning("Bookmark write for %s failed: %s", paper.get("arxiv_id"), error)
+        if bookmarked:
+            st.session_state["bookmarks"].discard(paper_id)
+            st.session_state["bookmarked_papers"].pop(paper_id, None)
+        else:
+            st.session_state["bookmarks"].add(paper_id)
+            st.session_state["bookmarked_papers"][paper_id] = paper
+
+        status_code = error.status_code if isinstance(error, BookmarkWriteError) else None
+        if status_code == 401:
+            # Later toggles stay local instead of failing against the dead session
+            st.session_state.pop("bookmark_session", None)
+        st.toast(_BOOKMARK_WRITE_ERRORS.get(status_code, "Could not save bookmark"), icon="⚠️")
+        rolled_back = True
+
+    st.session_state["_bookmark_writes"] = pending
+    return rolled_back
+
+
+@st.fragment(run_every=1)
+def watch_bookmark_writes():
+    """Polls background bookmark writes and reruns the page if one had to be rolled back."""
+    if _settle_bookmark_writes():
+        st.rerun()
+
+
+@st.fragment
+def render_card_actions(papers_by_id: dict, context: str):
+    """Action bar for the selected paper.
+
+    Runs as a fragment so picking a paper or toggling a bookmark only reruns
+    this row; actions that open a viewer still trigger a full rerun.
+    """
+    _settle_bookmark_writes()
+    select_col, *action_cols = st.columns([4, 1, 1, 1, 1])
+
+    with select_col:
+        paper_id = st.selectbox(
+            "Paper",
+            options=list(papers_by_id),
+            format_func=lambda pid: papers_by_id[pid]["title"],
+            key=f"selected_{context}",
+            label_visibility="collapsed",
+        )
+
+    paper = papers_by_id[paper_id]
+    arxiv_id = paper.get("arxiv_id") or paper_id
+    pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+    is_bookmarked = paper_id in st.session_state["bookmarks"]
+
+    with action_cols[0]:
+        # The callback runs before the fragment reruns, so the label is already current
+        st.button(
+            "⭐" if is_bookmarked else "☆",
+            key=f"bm_{context}",
+            use_container_width=True,
+            help="Bookmark",
+            on_click=_toggle_bookmark,
+            args=(paper_id, paper),
+        )
+
+    with action_cols[1]:
+        if st.button("📄", key=f"open_{context}", use_container_width=True, help="View PDF"):
+            st.session_state["active_pdf"] = pdf_url
+            st.session_state["active_pdf_title"] = paper["title"]
+            st.rerun()
+
+    with action_cols[2]:
+        if st.button("🧠", key=f"mm_{context}", use_container_width=True, help="Mind Map"):
+            with st.spinner("Generating..."):
+                try:
+                    mindmap = get_mindmap(arxiv_id)
+                    st.session_state["active_mindmap"] = mindmap
+                    st.session_state["active_mindmap_title"] = paper["title"]
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Failed: {e}")
+
+    with action_cols[3]:
+        if st.button("📇", key=f"fc_{context}", use_container_width=True, help="Flashcards"):
+            seen = st.session_state["_flashcards_by_paper"].get(arxiv_id)
+            if seen and time.time() - seen["t"] < FLASHCARDS_STALE_AFTER:
+                # Stale-while-revalidate: show the last copy now, refresh it in the background
+                flashcards = seen["val"]
+                st.session_state["_flashcards_refresh"] = (arxiv_id, refresh_flashcards_async(arxiv_id, num_cards=15))
+            else:
+                with st.spinner("Generating..."):
+                    try:
+                        flashcards = get_flashcards(arxiv_id, num_cards=15)
+                    except Exception as e:
+                        st.error(f"Failed: {e}")
+                        return
+                st.session_state["_flashcards_by_paper"][arxiv_id] = {"t": time.time(), "val": flashcards}
+
+            st.session_state["active_flashcards"] = flashcards
+            st.session_state["active_flashcards_arxiv_id"] = arxiv_id
+            st.session_state["active_flashcards_title"] = paper["title"]
+            st.session_state["current_card_index"] = 0
+            st.session_state["show_answer"] = False
+            st.session_state["studied_cards"] = set()
+            st.rerun()
 
 
 # ======================
 # Render tabs
 # ======================
+_settle_bookmark_writes()
+if st.session_state["_bookmark_writes"]:
+    watch_bookmark_writes()
+
 with tab_all:
     render_cards(papers, context="all")
 
 with tab_bookmarked:
-    bookmarked_papers = [p for p in papers if str(p["id"]) in st.session_state["bookmarks"]]
-    render_cards(bookmarked_papers, context="bookmarked")
+    # Bookmarked papers are kept by id when toggled, so this tab never scans the search results
+    if not st.session_state["bookmarked_papers"]:
+        st.info("No bookmarked papers yet.")
+    else:
+        render_cards(list(st.session_state["bookmarked_papers"].values()), context="bookmarked")
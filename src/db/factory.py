@@ -19,6 +19,8 @@ def make_database() -> BaseDatabase:
         echo_sql=settings.postgres_echo_sql,
         pool_size=settings.postgres_pool_size,
         max_overflow=settings.postgres_max_overflow,
+        pool_recycle=settings.postgres_pool_recycle,
+        pool_timeout=settings.postgres_pool_timeout,
     )
 
     database = PostgreSQLDatabase(config=config)
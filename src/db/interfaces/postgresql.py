@@ -1,7 +1,8 @@
 import logging
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Any, Generator, Optional
 
+import orjson
 from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
@@ -15,6 +16,11 @@ logger = logging.getLogger(__name__)
 Base = declarative_base()
 
 
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB column values with orjson (sections, references and metadata can be large)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
 class PostgreSQLDatabase(BaseDatabase):
     """PostgreSQL database implementation."""
 
@@ -39,6 +45,10 @@ class PostgreSQLDatabase(BaseDatabase):
                 pool_size=self.config.pool_size,
                 max_overflow=self.config.max_overflow,
                 pool_pre_ping=True,  # Verify connections before use
+                pool_recycle=self.config.pool_recycle,
+                pool_timeout=self.config.pool_timeout,
+                json_serializer=_json_serializer,
+                json_deserializer=orjson.loads,
             )
 
             self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
@@ -49,6 +59,8 @@ class PostgreSQLDatabase(BaseDatabase):
                 conn.execute(text("SELECT 1"))
                 logger.info("Database connection test successful")
 
+            self._warm_pool()
+
             logger.info("PostgreSQL database initialized successfully")
             assert self.engine is not None
             logger.info(f"Database: {self.engine.url.database}")
@@ -58,6 +70,20 @@ class PostgreSQLDatabase(BaseDatabase):
             logger.error(f"Failed to initialize PostgreSQL database: {e}")
             raise
 
+    def _warm_pool(self) -> None:
+        """Open every pooled connection up front so early requests skip connect/auth latency."""
+        assert self.engine is not None
+        connections = []
+        try:
+            for _ in range(self.config.pool_size):
+                connections.append(self.engine.connect())
+        except Exception as e:
+            logger.warning(f"Connection pool warm-up stopped after {len(connections)} connections: {e}")
+        finally:
+            for conn in connections:
+                conn.close()
+        logger.info(f"Connection pool warmed with {len(connections)} connections")
+
     def teardown(self) -> None:
         """Close the database connection."""
         if self.engine:
@@ -1,21 +1,44 @@
 from redis.asyncio import Redis, ConnectionPool
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
 from src.config import get_settings
 
 settings = get_settings()
 _pool: ConnectionPool | None = None
+_client: Redis | None = None
 
 
 def get_redis_pool() -> ConnectionPool:
     global _pool
     if _pool is None:
-        _pool = ConnectionPool(
-            host=settings.redis_host,
-            port=settings.redis_port,
+        _pool = ConnectionPool.from_url(
+            f"redis://{settings.redis_host}:{settings.redis_port}",
             decode_responses=True,
-            max_connections=10,
+            max_connections=settings.redis_max_connections,
+            socket_keepalive=True,
+            # Short timeouts keep a stalled cache from holding up request handlers
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+            retry_on_timeout=True,
+            retry=Retry(ExponentialBackoff(), 2),
         )
     return _pool
 
 
 def get_redis_client() -> Redis:
-    return Redis(connection_pool=get_redis_pool())
+    """Shared client over the shared pool; every caller reuses the same sockets."""
+    global _client
+    if _client is None:
+        _client = Redis(connection_pool=get_redis_pool())
+    return _client
+
+
+async def close_redis() -> None:
+    global _pool, _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    if _pool is not None:
+        await _pool.disconnect()
+        _pool = None
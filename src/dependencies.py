@@ -1,19 +1,21 @@
 from functools import lru_cache
-from typing import Annotated, Generator
+from typing import TYPE_CHECKING, Annotated, Generator
 
 from fastapi import Depends, Request
 from redis.asyncio import Redis
 from sqlalchemy.orm import Session
 from src.config import Settings
 from src.db.interfaces.base import BaseDatabase
-from src.repositories.flashcards import FlashcardRepository
-from src.services.arxiv.client import ArxivClient
-from src.services.embeddings.jina_client import JinaEmbeddingsClient
-from src.services.nvidia.client import NvidiaClient
 from src.services.opensearch.client import OpenSearchClient
-from src.services.pdf_parser.parser import PDFParserService
-from src.services.visualization.flashcards import FlashcardCache, FlashcardGenerator, FlashcardService
-from src.services.visualization.mindmaps.client import MindMapService
+
+if TYPE_CHECKING:
+    # Imported lazily by ServiceContainer; keep them out of app startup.
+    from src.services.arxiv.client import ArxivClient
+    from src.services.embeddings.nvidia_client import NIMEmbeddingsClient
+    from src.services.nvidia.client import NvidiaClient
+    from src.services.pdf_parser.parser import PDFParserService
+    from src.services.visualization.flashcards import FlashcardService
+    from src.services.visualization.mindmaps.client import MindMapService
 
 
 @lru_cache
@@ -33,9 +35,14 @@ def get_database(request: Request) -> BaseDatabase:
 
 
 def get_db_session(database: Annotated[BaseDatabase, Depends(get_database)]) -> Generator[Session, None, None]:
-    """Get database session dependency."""
+    """Get database session dependency.
+
+    Repositories only flush, so the whole request commits once here; an
+    exception rolls everything back instead.
+    """
     with database.get_session() as session:
         yield session
+        session.commit()
 
 
 def get_opensearch_client(request: Request) -> OpenSearchClient:
@@ -43,24 +50,24 @@ def get_opensearch_client(request: Request) -> OpenSearchClient:
     return request.app.state.opensearch_client
 
 
-def get_arxiv_client(request: Request) -> ArxivClient:
+def get_arxiv_client(request: Request) -> "ArxivClient":
     """Get arXiv client from the request state."""
-    return request.app.state.arxiv_client
+    return request.app.state.services.arxiv_client
 
 
-def get_pdf_parser(request: Request) -> PDFParserService:
+def get_pdf_parser(request: Request) -> "PDFParserService":
     """Get PDF parser service from the request state."""
-    return request.app.state.pdf_parser
+    return request.app.state.services.pdf_parser
 
 
-def get_embeddings_service(request: Request) -> JinaEmbeddingsClient:
+def get_embeddings_service(request: Request) -> "NIMEmbeddingsClient":
     """Get embeddings service from the request state."""
-    return request.app.state.embeddings_service
+    return request.app.state.services.embeddings_service
 
 
-def get_nvidia_client(request: Request) -> NvidiaClient:
+def get_nvidia_client(request: Request) -> "NvidiaClient":
     """Get nvidia client from the request state."""
-    return request.app.state.nvidia_client
+    return request.app.state.services.nvidia_client
 
 
 def get_redis_client(request: Request) -> Redis:
@@ -68,16 +75,18 @@ def get_redis_client(request: Request) -> Redis:
     return request.app.state.redis_client
 
 
-def get_mindmap_client(request: Request) -> MindMapService:
+def get_mindmap_client(request: Request) -> "MindMapService":
     """Get Mindmap client from the request state"""
-    return request.app.state.mindmap_client
+    return request.app.state.services.mindmap_client
 
 
 def get_flashcard_service(
     db=Depends(get_db_session),
     redis=Depends(get_redis_client),
     nvidia=Depends(get_nvidia_client),
-) -> FlashcardService:
+) -> "FlashcardService":
+    from src.repositories.flashcards import FlashcardRepository
+    from src.services.visualization.flashcards import FlashcardCache, FlashcardGenerator, FlashcardService
 
     generator = FlashcardGenerator(nvidia_client=nvidia)
 
@@ -97,10 +106,10 @@ SettingsDep = Annotated[Settings, Depends(get_settings)]
 DatabaseDep = Annotated[BaseDatabase, Depends(get_database)]
 SessionDep = Annotated[Session, Depends(get_db_session)]
 OpenSearchDep = Annotated[OpenSearchClient, Depends(get_opensearch_client)]
-MindMapDep = Annotated[MindMapService, Depends(get_mindmap_client)]
-ArxivDep = Annotated[ArxivClient, Depends(get_arxiv_client)]
-PDFParserDep = Annotated[PDFParserService, Depends(get_pdf_parser)]
-EmbeddingsDep = Annotated[JinaEmbeddingsClient, Depends(get_embeddings_service)]
-NvidiaDep = Annotated[NvidiaClient, Depends(get_nvidia_client)]
+MindMapDep = Annotated["MindMapService", Depends(get_mindmap_client)]
+ArxivDep = Annotated["ArxivClient", Depends(get_arxiv_client)]
+PDFParserDep = Annotated["PDFParserService", Depends(get_pdf_parser)]
+EmbeddingsDep = Annotated["NIMEmbeddingsClient", Depends(get_embeddings_service)]
+NvidiaDep = Annotated["NvidiaClient", Depends(get_nvidia_client)]
 RedisDep = Annotated[Redis, Depends(get_redis_client)]
-FlashCardDep = Annotated[FlashcardService, Depends(get_flashcard_service)]
+FlashCardDep = Annotated["FlashcardService", Depends(get_flashcard_service)]
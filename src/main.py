@@ -1,21 +1,18 @@
+import asyncio
 import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from src.config import get_settings
 from src.db.factory import make_database
-from src.db.redis.redis import get_redis_client
-from src.routers import hybrid_search, papers, ping, visualization
+from src.db.redis.redis import close_redis, get_redis_client
+from src.routers import bookmarks, hybrid_search, papers, ping, visualization
 from src.routers.ask import ask_router, stream_router
-from src.services.arxiv.factory import make_arxiv_client
-from src.services.embeddings.factory import make_embeddings_service
-from src.services.nvidia.factory import make_nvidia_client
+from src.services.container import ServiceContainer
 from src.services.opensearch.factory import make_opensearch_client
-from src.services.pdf_parser.factory import make_pdf_parser_service
-from src.services.visualization.flashcards.factory import get_flashcard_service
-from src.services.visualization.mindmaps.factory import get_mindmap_service
 
 # Setup logging
 logging.basicConfig(
@@ -25,29 +22,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """
-    Lifespan for the API.
-    """
-    logger.info("Starting RAG API...")
-
-    settings = get_settings()
-    app.state.settings = settings
-
-    # Initialize DB
-    database = make_database()
-    app.state.database = database
-    logger.info("Database connected")
-
-    # Initialize Redis Cache Client
+async def _init_redis():
     redis_client = get_redis_client()
-    app.state.redis_client = redis_client
-    logger.info("Redis client connected")
+    try:
+        await redis_client.ping()  # Open the first pooled connection before traffic arrives
+        logger.info("Redis client connected")
+    except Exception as e:
+        logger.warning(f"Redis ping failed, caching will be degraded: {e}")
+    return redis_client
 
-    # Initialize search service
+
+def _init_opensearch():
     opensearch_client = make_opensearch_client()
-    app.state.opensearch_client = opensearch_client
 
     # Verify OpenSearch connectivity and create index if needed
     if opensearch_client.health_check():
@@ -69,19 +55,54 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("OpenSearch connection failed - search features will be limited")
 
-    # Initialize other services (kept for future endpoints and notebook demos)
-    app.state.arxiv_client = make_arxiv_client()
-    app.state.pdf_parser = make_pdf_parser_service()
-    app.state.embeddings_service = make_embeddings_service()
-    app.state.nvidia_client = make_nvidia_client()
-    app.state.mindmap_client = get_mindmap_service()
-    app.state.flashcard_service = get_flashcard_service()
-    logger.info("Services initialized: arXiv API client, PDF parser, OpenSearch, Embeddings, Nvidia")
+    return opensearch_client
+
+
+async def _prewarm_nvidia(services: ServiceContainer):
+    # Building the client imports the OpenAI SDK, so keep it off the event loop
+    try:
+        nvidia_client = await asyncio.to_thread(lambda: services.nvidia_client)
+    except Exception as e:
+        logger.warning(f"NVIDIA client could not be built for prewarm: {e}")
+        return
+    await nvidia_client.prewarm()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lifespan for the API.
+    """
+    logger.info(f"Starting RAG API... (event loop: {type(asyncio.get_running_loop()).__module__})")
+
+    settings = get_settings()
+    app.state.settings = settings
+
+    # DB, Redis and OpenSearch handshakes are independent, so run them concurrently
+    database, redis_client, opensearch_client = await asyncio.gather(
+        asyncio.to_thread(make_database),
+        _init_redis(),
+        asyncio.to_thread(_init_opensearch),
+    )
+    app.state.database = database
+    app.state.redis_client = redis_client
+    app.state.opensearch_client = opensearch_client
+    logger.info("Database connected")
+
+    # Other services (arXiv, PDF parser, embeddings, mind maps) are built on first use
+    app.state.services = ServiceContainer()
+    # Opt-in: warm the NVIDIA keep-alive pool in the background; startup does not wait on the LLM endpoint
+    nvidia_prewarm = asyncio.create_task(_prewarm_nvidia(app.state.services)) if settings.nvidia_prewarm else None
     logger.info("API ready")
     yield
 
     # Cleanup
+    if nvidia_prewarm is not None:
+        nvidia_prewarm.cancel()
+        with suppress(asyncio.CancelledError):
+            await nvidia_prewarm
     database.teardown()
+    await close_redis()
     logger.info("API shutdown complete")
 
 
@@ -90,11 +111,13 @@ app = FastAPI(
     description="Personal arXiv paper curator with Visualization, Detailed Analysis and RAG Features",
     version=os.getenv("APP_VERSION", "0.1.0"),
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Routers
 app.include_router(ping.router, prefix="/api/v1")  # Health check endpoint
 app.include_router(papers.router, prefix="/api/v1")
+app.include_router(bookmarks.router, prefix="/api/v1")
 # Search chunks with BM25/hybrid
 app.include_router(hybrid_search.router, prefix="/api/v1")
 
@@ -107,4 +130,11 @@ app.include_router(stream_router, prefix="/api/v1")  # Streaming RAG responses
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, port=8000, host="0.0.0.0")
+    uvicorn.run(
+        "src.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "4")),
+    )
@@ -1,7 +1,6 @@
 import uuid
-from datetime import datetime, timezone
 
-from sqlalchemy import JSON, Boolean, CheckConstraint, Column, DateTime, Index, String, Text
+from sqlalchemy import JSON, Boolean, CheckConstraint, Column, Computed, DateTime, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from src.db.interfaces.postgresql import Base
 
@@ -9,8 +8,15 @@ from src.db.interfaces.postgresql import Base
 class Paper(Base):
     __tablename__ = "papers"
 
-    # Full-text search vector
-    search_vector = Column(TSVECTOR)
+    # Full-text search vector (generated by PostgreSQL from title and abstract)
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(abstract, '')), 'B')",
+            persisted=True,
+        ),
+    )
 
     # Table-level constraints and indexes
     __table_args__ = (
@@ -20,6 +26,33 @@ class Paper(Base):
             "search_vector",
             postgresql_using="gin",
         ),
+        # GIN index for category containment (@>) filters
+        Index(
+            "ix_papers_categories",
+            "categories",
+            postgresql_using="gin",
+            postgresql_ops={"categories": "jsonb_path_ops"},
+        ),
+        # Btree index for the published_date orderings (scanned backwards for DESC)
+        Index("ix_papers_published_date", "published_date"),
+        # Btree index for the "recently created papers" indexing query
+        Index("ix_papers_created_at", "created_at"),
+        # Partial indexes for the PDF processing listings
+        Index(
+            "ix_papers_raw_text_present",
+            text("pdf_processing_date DESC"),
+            postgresql_where=text("raw_text IS NOT NULL"),
+        ),
+        Index(
+            "ix_papers_processed",
+            text("pdf_processing_date DESC"),
+            postgresql_where=text("pdf_processed = true"),
+        ),
+        Index(
+            "ix_papers_unprocessed",
+            text("published_date DESC"),
+            postgresql_where=text("pdf_processed = false"),
+        ),
         # Check constraint: arxiv papers must have arxiv_id
         CheckConstraint("source != 'arxiv' OR arxiv_id IS NOT NULL", name="check_arxiv_has_id"),
     )
@@ -62,10 +95,13 @@ class Paper(Base):
     pdf_processed = Column(Boolean, default=False, nullable=False)
     pdf_processing_date = Column(DateTime, nullable=True)
 
-    # Timestamps
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    # Timestamps (naive UTC, stamped by the database clock)
+    created_at = Column(DateTime, server_default=func.timezone("utc", func.now()), nullable=False)
     updated_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False
+        DateTime,
+        server_default=func.timezone("utc", func.now()),
+        onupdate=func.timezone("utc", func.now()),
+        nullable=False,
     )
 
     def __repr__(self):
@@ -8,7 +8,7 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.orm import Session
 from src.models.flashcards import Flashcard as FlashcardModel
 from src.models.flashcards import FlashcardSetMetadata as FlashcardSetMetadataModel
@@ -17,7 +17,11 @@ logger = logging.getLogger(__name__)
 
 
 class FlashcardRepository:
-    """Repository for flashcard database operations."""
+    """Repository for flashcard database operations.
+
+    Methods flush but never commit; the caller (normally the request-scoped
+    session dependency) commits once.
+    """
 
     def __init__(self, session: Session):
         self.session = session
@@ -113,7 +117,7 @@ class FlashcardRepository:
         stmt = select(FlashcardSetMetadataModel)
 
         if only_fresh:
-            stmt = stmt.where(FlashcardSetMetadataModel.expires_at > datetime.now(timezone.utc))
+            stmt = stmt.where(FlashcardSetMetadataModel.expires_at > func.now())
 
         stmt = stmt.order_by(FlashcardSetMetadataModel.generated_at.desc())
         stmt = stmt.limit(limit).offset(offset)
@@ -153,20 +157,23 @@ class FlashcardRepository:
         now = datetime.now(timezone.utc)
         expires_at = now + timedelta(days=ttl_days)
 
-        # 1. Create flashcard records
+        # 1. Create flashcard records in one batched INSERT ... RETURNING
+        rows = [
+            {
+                "paper_id": paper_id,
+                "front": card_data["front"],
+                "back": card_data["back"],
+                "topic": card_data.get("topic"),
+                "difficulty": card_data.get("difficulty"),
+                "card_index": card_data["card_index"],
+                "generated_at": now,
+            }
+            for card_data in flashcards
+        ]
         flashcard_models = []
-        for card_data in flashcards:
-            flashcard = FlashcardModel(
-                paper_id=paper_id,
-                front=card_data["front"],
-                back=card_data["back"],
-                topic=card_data.get("topic"),
-                difficulty=card_data.get("difficulty"),
-                card_index=card_data["card_index"],
-                generated_at=now,
-            )
-            self.session.add(flashcard)
-            flashcard_models.append(flashcard)
+        if rows:
+            stmt = insert(FlashcardModel).returning(FlashcardModel, sort_by_parameter_order=True)
+            flashcard_models = list(self.session.scalars(stmt, rows))
 
         # 2. Create set metadata
         metadata = FlashcardSetMetadataModel(
@@ -180,13 +187,9 @@ class FlashcardRepository:
         )
         self.session.add(metadata)
 
-        # 3. Commit everything
-        self.session.commit()
-
-        # 4. Refresh to get IDs
-        for flashcard in flashcard_models:
-            self.session.refresh(flashcard)
-        self.session.refresh(metadata)
+        # 3. Flush the metadata row; the request-level session commits. RETURNING already
+        #    populated the card IDs, so no per-row refresh is needed
+        self.session.flush()
 
         logger.info(
             "Flashcard set created", extra={"paper_id": paper_id, "total_cards": len(flashcards), "model_used": model_used}
@@ -234,8 +237,7 @@ class FlashcardRepository:
         )
 
         self.session.add(flashcard)
-        self.session.commit()
-        self.session.refresh(flashcard)
+        self.session.flush()  # Assigns the id
 
         return flashcard
 
@@ -262,8 +264,7 @@ class FlashcardRepository:
         if difficulty is not None:
             flashcard.difficulty = difficulty
 
-        self.session.commit()
-        self.session.refresh(flashcard)
+        self.session.flush()
 
         return flashcard
 
@@ -288,8 +289,6 @@ class FlashcardRepository:
         metadata_result = self.session.execute(metadata_stmt)
         metadata_deleted = metadata_result.rowcount > 0
 
-        self.session.commit()
-
         if cards_deleted > 0 or metadata_deleted:
             logger.info("Flashcard set deleted", extra={"paper_id": paper_id, "cards_deleted": cards_deleted})
 
@@ -299,7 +298,6 @@ class FlashcardRepository:
         """Delete a single flashcard by ID."""
         stmt = delete(FlashcardModel).where(FlashcardModel.id == flashcard_id)
         result = self.session.execute(stmt)
-        self.session.commit()
 
         return result.rowcount > 0
 
@@ -309,29 +307,27 @@ class FlashcardRepository:
 
         Returns number of sets deleted.
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
-
-        # Get paper_ids of expired sets
-        stmt = select(FlashcardSetMetadataModel.paper_id).where(FlashcardSetMetadataModel.expires_at < cutoff)
-        expired_paper_ids = list(self.session.scalars(stmt))
-
-        if not expired_paper_ids:
-            return 0
-
-        # Delete flashcards for these papers
-        cards_stmt = delete(FlashcardModel).where(FlashcardModel.paper_id.in_(expired_paper_ids))
+        cutoff = func.now() - timedelta(days=older_than_days)
+        expired_paper_ids = select(FlashcardSetMetadataModel.paper_id).where(FlashcardSetMetadataModel.expires_at < cutoff)
+
+        # Delete flashcards for these papers; the subquery keeps the ids server-side
+        cards_stmt = (
+            delete(FlashcardModel)
+            .where(FlashcardModel.paper_id.in_(expired_paper_ids))
+            .execution_options(synchronize_session=False)  # "fetch" would RETURNING every id
+        )
         self.session.execute(cards_stmt)
 
-        # Delete metadata
-        metadata_stmt = delete(FlashcardSetMetadataModel).where(FlashcardSetMetadataModel.paper_id.in_(expired_paper_ids))
-        self.session.execute(metadata_stmt)
-
-        self.session.commit()
-
-        deleted_count = len(expired_paper_ids)
+        # Delete metadata; now() is fixed for the transaction, so both statements see the same cutoff
+        metadata_stmt = (
+            delete(FlashcardSetMetadataModel)
+            .where(FlashcardSetMetadataModel.expires_at < cutoff)
+            .execution_options(synchronize_session=False)
+        )
+        deleted_count = self.session.execute(metadata_stmt).rowcount
 
         if deleted_count > 0:
-            logger.info("Expired flashcard sets deleted", extra={"count": deleted_count, "cutoff": cutoff})
+            logger.info("Expired flashcard sets deleted", extra={"count": deleted_count, "older_than_days": older_than_days})
 
         return deleted_count
 
@@ -351,7 +347,7 @@ class FlashcardRepository:
         fresh_sets = (
             self.session.scalar(
                 select(func.count(FlashcardSetMetadataModel.paper_id)).where(
-                    FlashcardSetMetadataModel.expires_at > datetime.now(timezone.utc)
+                    FlashcardSetMetadataModel.expires_at > func.now()
                 )
             )
             or 0
@@ -1,21 +1,30 @@
-from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, defer
 from src.models.paper import Paper
 from src.schemas.arxiv.paper import PaperCreate, PaperSearchFilters
 from sqlalchemy import or_
 
+# Listings never need the parsed PDF payload (raw_text alone can run to megabytes per row).
+# raiseload turns an accidental access into an error instead of a silent per-row lazy load.
+WITHOUT_CONTENT = tuple(
+    defer(column, raiseload=True)
+    for column in (Paper.raw_text, Paper.sections, Paper.references, Paper.parser_metadata)
+)
+
 class PaperRepository:
+    """Paper data access. Methods flush but never commit; the caller owns the transaction."""
+
     def __init__(self, session: Session):
         self.session = session
 
     def create(self, paper: PaperCreate) -> Paper:
         db_paper = Paper(**paper.model_dump())
         self.session.add(db_paper)
-        self.session.commit()
+        self.session.flush()
         self.session.refresh(db_paper)
         return db_paper
 
@@ -23,17 +32,23 @@ class PaperRepository:
         stmt = select(Paper).where(Paper.arxiv_id == arxiv_id)
         return self.session.scalar(stmt)
 
+    def get_by_arxiv_ids(self, arxiv_ids: List[str]) -> List[Paper]:
+        stmt = select(Paper).options(*WITHOUT_CONTENT).where(Paper.arxiv_id.in_(arxiv_ids)).order_by(
+            Paper.published_date.desc())
+        return list(self.session.scalars(stmt))
+
     def get_by_id(self, paper_id: UUID) -> Optional[Paper]:
         stmt = select(Paper).where(Paper.id == paper_id)
         return self.session.scalar(stmt)
 
     def get_all(self, limit: int = 100, offset: int = 0) -> List[Paper]:
-        stmt = select(Paper).order_by(
+        stmt = select(Paper).options(*WITHOUT_CONTENT).order_by(
             Paper.published_date.desc()).limit(limit).offset(offset)
         return list(self.session.scalars(stmt))
 
-    def search(self, filters: PaperSearchFilters, limit: int = 20, offset: int = 0,) -> List[Paper]:
-        stmt = select(Paper)
+    def search(self, filters: PaperSearchFilters, limit: int = 20, offset: int = 0,) -> Tuple[List[Paper], int]:
+        # count(*) OVER () carries the filtered total on every row, so one query yields page + total
+        stmt = select(Paper, func.count().over().label("total")).options(*WITHOUT_CONTENT)
 
         # ---- Full-text search ----
         if filters.query:
@@ -70,24 +85,25 @@ class PaperRepository:
         if filters.published_before:
             stmt = stmt.where(Paper.published_date <= filters.published_before)
 
-        # ---- Total count (before pagination) ----
-        total = self.session.scalar(
-            select(func.count()).select_from(stmt.subquery())
-        ) or 0
-
         # ---- Pagination ----
-        stmt = stmt.limit(limit).offset(offset)
+        rows = self.session.execute(stmt.limit(limit).offset(offset)).all()
+        if rows:
+            return [row.Paper for row in rows], rows[0].total
 
-        return list(self.session.scalars(stmt))
+        # An empty page past the end carries no total; fall back to counting
+        if offset:
+            return [], self.session.scalar(select(func.count()).select_from(stmt.subquery())) or 0
+        return [], 0
 
     def get_count(self) -> int:
         stmt = select(func.count(Paper.id))
         return self.session.scalar(stmt) or 0
 
     def get_processed_papers(self, limit: int = 100, offset: int = 0) -> List[Paper]:
-        """Get papers that have been successfully processed with PDF content."""
+        """Get papers that have been successfully processed with PDF content (content itself is not loaded)."""
         stmt = (
             select(Paper)
+            .options(*WITHOUT_CONTENT)
             .where(Paper.pdf_processed == True)
             .order_by(Paper.pdf_processing_date.desc())
             .limit(limit)
@@ -97,28 +113,26 @@ class PaperRepository:
 
     def get_unprocessed_papers(self, limit: int = 100, offset: int = 0) -> List[Paper]:
         """Get papers that haven't been processed for PDF content yet."""
-        stmt = select(Paper).where(Paper.pdf_processed == False).order_by(
+        stmt = select(Paper).options(*WITHOUT_CONTENT).where(Paper.pdf_processed == False).order_by(
             Paper.published_date.desc()).limit(limit).offset(offset)
         return list(self.session.scalars(stmt))
 
     def get_papers_with_raw_text(self, limit: int = 100, offset: int = 0) -> List[Paper]:
         """Get papers that have raw text content stored."""
-        stmt = select(Paper).where(Paper.raw_text != None).order_by(
+        stmt = select(Paper).where(Paper.raw_text.isnot(None)).order_by(
             Paper.pdf_processing_date.desc()).limit(limit).offset(offset)
         return list(self.session.scalars(stmt))
 
     def get_processing_stats(self) -> dict:
         """Get statistics about PDF processing status."""
-        total_papers = self.get_count()
-
-        # Count processed papers
-        processed_stmt = select(func.count(Paper.id)).where(
-            Paper.pdf_processed == True)
-        processed_papers = self.session.scalar(processed_stmt) or 0
-
-        # Count papers with text
-        text_stmt = select(func.count(Paper.id)).where(Paper.raw_text != None)
-        papers_with_text = self.session.scalar(text_stmt) or 0
+        # One scan with filtered aggregates instead of three separate COUNT queries
+        stmt = select(
+            func.count(Paper.id).label("total"),
+            func.count(Paper.id).filter(Paper.pdf_processed.is_(True)).label("processed"),
+            func.count(Paper.id).filter(Paper.raw_text.isnot(None)).label("with_text"),
+        )
+        counts = self.session.execute(stmt).one()
+        total_papers, processed_papers, papers_with_text = counts.total, counts.processed, counts.with_text
 
         return {
             "total_papers": total_papers,
@@ -130,18 +144,39 @@ class PaperRepository:
 
     def update(self, paper: Paper) -> Paper:
         self.session.add(paper)
-        self.session.commit()
+        self.session.flush()
         self.session.refresh(paper)
         return paper
 
     def upsert(self, paper_create: PaperCreate) -> Paper:
-        # Check if paper already exists
-        existing_paper = self.get_by_arxiv_id(paper_create.arxiv_id)
-        if existing_paper:
-            # Update existing paper with new content
-            for key, value in paper_create.model_dump(exclude_unset=True).items():
-                setattr(existing_paper, key, value)
-            return self.update(existing_paper)
-        else:
-            # Create new paper
-            return self.create(paper_create)
+        # Single INSERT ... ON CONFLICT round trip; only the fields the caller set overwrite an existing row
+        row = paper_create.model_dump(exclude_unset=True)
+        stmt = insert(Paper).values(**row)
+        update_columns = {column: stmt.excluded[column] for column in row if column != "arxiv_id"}
+        update_columns["updated_at"] = func.timezone("utc", func.now())
+        stmt = (
+            stmt.on_conflict_do_update(index_elements=[Paper.arxiv_id], set_=update_columns)
+            .returning(Paper)
+            .execution_options(populate_existing=True)
+        )
+        return self.session.scalars(stmt).one()
+
+    def bulk_upsert(self, papers: List[PaperCreate]) -> int:
+        # Deduplicate by arxiv_id (last wins) so one statement never touches a row twice
+        rows_by_arxiv_id = {paper.arxiv_id: paper.model_dump(exclude_unset=True) for paper in papers}
+
+        # Group rows by the fields they carry so metadata-only rows never overwrite parsed content
+        groups: Dict[Tuple[str, ...], List[dict]] = {}
+        for row in rows_by_arxiv_id.values():
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        for columns, rows in groups.items():
+            stmt = insert(Paper)
+            update_columns = {column: stmt.excluded[column] for column in columns if column != "arxiv_id"}
+            update_columns["updated_at"] = func.timezone("utc", func.now())
+            stmt = stmt.on_conflict_do_update(index_elements=[Paper.arxiv_id], set_=update_columns)
+
+            # executemany: psycopg2 batches the parameter sets into multi-row VALUES pages
+            self.session.execute(stmt, rows)
+
+        return len(rows_by_arxiv_id)
@@ -1,6 +1,12 @@
 """Router modules for the RAG API."""
 
-# Import all available routers
-from . import ask, hybrid_search, ping
+import importlib
 
-__all__ = ["ask", "ping", "hybrid_search"]
+__all__ = ["ask", "bookmarks", "hybrid_search", "papers", "ping", "visualization"]
+
+
+def __getattr__(name: str):
+    # Load router modules on first access so importing one router does not pull in the rest
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
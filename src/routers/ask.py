@@ -3,7 +3,7 @@ import logging
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
-from src.dependencies import EmbeddingsDep, NvidiaDep, OpenSearchDep
+from src.dependencies import EmbeddingsDep, NvidiaDep, OpenSearchDep, RedisDep
 from src.schemas.api.ask import AskRequest, AskResponse
 
 logger = logging.getLogger(__name__)
@@ -81,6 +81,7 @@ async def ask_question(
     opensearch_client: OpenSearchDep,
     embeddings_service: EmbeddingsDep,
     nvidia_client: NvidiaDep,
+    redis: RedisDep,
 ) -> AskResponse:
     """
     RAG endpoint for question answering.
@@ -120,8 +121,8 @@ async def ask_question(
                     request.model}")
 
         # Generate answer using LLM
-        rag_response = nvidia_client.generate_rag_answer(
-            query=request.query, chunks=chunks, model=request.model)
+        rag_response = await nvidia_client.generate_rag_answer(
+            query=request.query, chunks=chunks, model=request.model, cache=redis)
 
         logger.debug(f"RAG response: {rag_response}")
 
@@ -0,0 +1,97 @@
+import asyncio
+import secrets
+from typing import Annotated, Dict, List
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, status
+from src.config import get_settings
+from src.dependencies import RedisDep, SessionDep
+from src.repositories.paper import PaperRepository
+from src.schemas.arxiv.paper import ARXIV_ID_PATTERN, PaperSummaryResponse
+
+router = APIRouter(prefix="/bookmarks", tags=["bookmarks"])
+
+settings = get_settings()
+
+SESSION_HEADER = "X-Bookmark-Session"
+# secrets.token_urlsafe(32)
+SESSION_ID_PATTERN = r"^[A-Za-z0-9_-]{43}$"
+
+
+def _session_key(session_id: str) -> str:
+    return f"bookmark_session:{session_id}"
+
+
+def _bookmarks_key(session_id: str) -> str:
+    return f"bookmarks:{session_id}"
+
+
+async def get_bookmark_session(
+    redis: RedisDep,
+    session_id: str = Header(..., alias=SESSION_HEADER, pattern=SESSION_ID_PATTERN),
+) -> str:
+    """Resolve a server-issued bookmark session, sliding its expiry; unknown or expired ids are rejected."""
+    ttl = settings.redis_bookmark_session_ttl_seconds
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.expire(_session_key(session_id), ttl)
+        pipe.expire(_bookmarks_key(session_id), ttl)
+        known, _ = await pipe.execute()
+    if not known:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unknown or expired bookmark session")
+    return session_id
+
+
+BookmarkSessionDep = Annotated[str, Depends(get_bookmark_session)]
+
+
+@router.post("/session", status_code=status.HTTP_201_CREATED)
+async def create_bookmark_session(redis: RedisDep) -> Dict[str, str]:
+    """Issue a new bookmark session id; clients send it back in the X-Bookmark-Session header."""
+    session_id = secrets.token_urlsafe(32)
+    await redis.set(_session_key(session_id), 1, ex=settings.redis_bookmark_session_ttl_seconds)
+    return {"session_id": session_id}
+
+
+@router.get("")
+async def list_bookmarks(
+    redis: RedisDep,
+    db: SessionDep,
+    session_id: BookmarkSessionDep,
+) -> Dict[str, List[PaperSummaryResponse]]:
+    """Return the bookmarked papers; only arXiv ids are stored, summaries come from the database."""
+    arxiv_ids = await redis.smembers(_bookmarks_key(session_id))
+    if not arxiv_ids:
+        return {"bookmarks": []}
+    papers = await asyncio.to_thread(PaperRepository(db).get_by_arxiv_ids, list(arxiv_ids))
+    return {"bookmarks": [PaperSummaryResponse.model_validate(paper) for paper in papers]}
+
+
+@router.put("/{arxiv_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def add_bookmark(
+    redis: RedisDep,
+    session_id: BookmarkSessionDep,
+    arxiv_id: str = Path(..., pattern=ARXIV_ID_PATTERN),
+) -> None:
+    """Bookmark a paper by arXiv id."""
+    key = _bookmarks_key(session_id)
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.sadd(key, arxiv_id)
+        pipe.scard(key)
+        pipe.expire(key, settings.redis_bookmark_session_ttl_seconds)
+        added, size, _ = await pipe.execute()
+
+    if added and size > settings.bookmarks_max_per_session:
+        await redis.srem(key, arxiv_id)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Bookmark limit of {settings.bookmarks_max_per_session} papers reached",
+        )
+
+
+@router.delete("/{arxiv_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remove_bookmark(
+    redis: RedisDep,
+    session_id: BookmarkSessionDep,
+    arxiv_id: str = Path(..., pattern=ARXIV_ID_PATTERN),
+) -> None:
+    """Remove a bookmark."""
+    await redis.srem(_bookmarks_key(session_id), arxiv_id)
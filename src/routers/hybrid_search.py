@@ -66,7 +66,7 @@ async def hybrid_search(
             hits=hits,
             size=request.size,
             **{"from": request.from_},
-            search_mode="hybrid" if (request.use_hybrid and query_embedding) else "bm25",
+            search_mode="hybrid" if (request.use_hybrid and query_embedding is not None) else "bm25",
         )
 
         logger.info(f"Search completed: {search_response.total} results returned")
@@ -4,7 +4,13 @@ from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from sqlalchemy.orm import Session
 from src.dependencies import SessionDep
 from src.repositories.paper import PaperRepository
-from src.schemas.arxiv.paper import PaperResponse, PaperSearchFilters, PaperSearchResponse
+from src.schemas.arxiv.paper import (
+    ARXIV_ID_PATTERN,
+    PaperResponse,
+    PaperSearchFilters,
+    PaperSearchResponse,
+    PaperSummaryResponse,
+)
 
 router = APIRouter(prefix="/papers", tags=["papers"])
 
@@ -24,7 +30,7 @@ def list_papers(
     # Get total count for pagination info
     total = paper_repo.get_count()
 
-    return PaperSearchResponse(papers=[PaperResponse.model_validate(paper) for paper in papers], total=total)
+    return PaperSearchResponse(papers=[PaperSummaryResponse.model_validate(paper) for paper in papers], total=total)
 
 
 @router.get("/search")
@@ -47,18 +53,16 @@ def search_papers(
     )
 
     repo = PaperRepository(db)
-    papers = repo.search(filters, limit, offset)
-    # Get total count for pagination info
-    total = repo.get_count()
+    papers, total = repo.search(filters, limit, offset)
 
-    return PaperSearchResponse(papers=[PaperResponse.model_validate(paper) for paper in papers], total=total)
+    return PaperSearchResponse(papers=[PaperSummaryResponse.model_validate(paper) for paper in papers], total=total)
 
 
 @router.get("/{arxiv_id}", response_model=PaperResponse)
 def get_paper_details(
     db: SessionDep,
     arxiv_id: str = Path(
-        ..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", regex=r"^\d{4}\.\d{4,5}(v\d+)?$"
+        ..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", pattern=ARXIV_ID_PATTERN
     ),
 ) -> PaperResponse:
     """Get details of a specific paper by arXiv ID."""
@@ -6,13 +6,16 @@ Unified endpoints for paper visualizations and study tools.
 Location: src/routers/visualization.py
 """
 
+import asyncio
 import logging
+from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response, status
 from sqlalchemy.orm import Session
 from src.dependencies import FlashCardDep, MindMapDep, OpenSearchDep, SessionDep
 from src.repositories.paper import PaperRepository
+from src.schemas.arxiv.paper import ARXIV_ID_PATTERN
 from src.schemas.visualization.flashcards import (
     FlashcardCacheStatus,
     FlashcardResponse,
@@ -43,22 +46,25 @@ async def get_mindmap(
     opensearch: OpenSearchDep,
     db: SessionDep,
     paper_id: str = Path(
-        ..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", regex=r"^\d{4}\.\d{4,5}(v\d+)?$"
+        ..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", pattern=ARXIV_ID_PATTERN
     ),
 ):
     """Get or generate mind map for a paper."""
     paper_repo = PaperRepository(db)
 
-    # 1. Verify paper exists and get title
-    paper = paper_repo.get_by_arxiv_id(paper_id)
+    # 1-2. Look up the paper and fetch its chunks concurrently; the two stores are independent
+    paper, chunks = await asyncio.gather(
+        asyncio.to_thread(paper_repo.get_by_arxiv_id, paper_id),
+        asyncio.to_thread(opensearch.get_chunks_by_paper, paper_id),
+    )
+
+    # Verify paper exists
     if not paper:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Paper {paper_id} not found",
         )
 
-    # 2. Fetch all chunks for this paper from OpenSearch
-    chunks = opensearch.get_chunks_by_paper(paper_id)
     if not chunks:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -123,14 +129,16 @@ async def get_flashcards(
     flashcard_service: FlashCardDep,
     opensearch: OpenSearchDep,
     db: SessionDep,
+    response: Response,
     paper_id: str = Path(
-        ..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", regex=r"^\d{4}\.\d{4,5}(v\d+)?$"
+        ..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", pattern=ARXIV_ID_PATTERN
     ),
     num_cards: int = Query(default=15, ge=5, le=50, description="Number of flashcards to generate"),
     topics: Optional[str] = Query(
         default=None, description="Comma-separated list of topics to focus on (e.g., 'Architecture,Methods')"
     ),
     force_refresh: bool = Query(default=False, description="Force regeneration even if cached flashcards exist"),
+    if_none_match: Optional[str] = Header(default=None),
 ):
     """
     Get or generate study flashcards for a paper.
@@ -139,7 +147,7 @@ async def get_flashcards(
     1. Verify paper exists
     2. Retrieve chunks from OpenSearch
     3. Get/generate flashcards (checks cache → DB → LLM)
-    4. Return flashcard set
+    4. Return flashcard set, or 304 if the client's ETag still matches
     """
     paper_repo = PaperRepository(db)
 
@@ -208,29 +216,22 @@ async def get_flashcards(
         logger.error("Flashcard generation failed", extra={"paper_id": paper_id, "error": str(e)})
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Failed to generate flashcards: {str(e)}")
 
-    # 5. Build response
-    flashcard_responses = [
-        FlashcardResponse(
-            id=fc.id,
-            paper_id=fc.paper_id,
-            front=fc.front,
-            back=fc.back,
-            topic=fc.topic,
-            difficulty=fc.difficulty,
-            card_index=fc.card_index,
-            generated_at=fc.generated_at,
-        )
-        for fc in flashcard_set.flashcards
-    ]
+    # A set is immutable once generated, so its generation time identifies it
+    etag = f'W/"{flashcard_set.arxiv_id}-{num_cards}-{flashcard_set.generated_at.timestamp():.0f}"'
+    if not force_refresh and if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    # 5. Build response (cards were validated when the set was built; skip re-validating each one)
+    flashcard_responses = [FlashcardResponse.model_construct(**dict(fc)) for fc in flashcard_set.flashcards]
 
     # Gather topics covered
     topics_covered = list(set(fc.topic for fc in flashcard_set.flashcards if fc.topic))
 
-    # Check cache status
+    # Check cache status; freshness comes from the set itself rather than another DB lookup
     cache_status = await flashcard_service.get_cache_status(str(paper.id))
-    db_status = flashcard_service.get_db_status(str(paper.id))
 
-    response = FlashcardSetResponse(
+    flashcard_set_response = FlashcardSetResponse(
         paper_id=flashcard_set.paper_id,
         arxiv_id=flashcard_set.arxiv_id,
         paper_title=flashcard_set.paper_title,
@@ -239,7 +240,7 @@ async def get_flashcards(
             "total_cards": flashcard_set.total_cards,
             "generated_at": flashcard_set.generated_at.isoformat(),
             "expires_at": flashcard_set.expires_at.isoformat(),
-            "is_fresh": db_status.get("is_fresh", True),
+            "is_fresh": flashcard_set.expires_at > datetime.now(timezone.utc),
             "is_cached": cache_status.is_cached,
             "topics_covered": topics_covered,
             "model_used": flashcard_set.model_used,
@@ -255,7 +256,7 @@ async def get_flashcards(
         },
     )
 
-    return response
+    return flashcard_set_response
 
 
 @router.post(
@@ -267,7 +268,8 @@ async def regenerate_flashcards(
     flashcard_service: FlashCardDep,
     opensearch: OpenSearchDep,
     db: SessionDep,
-    paper_id: str = Path(..., description="arXiv paper ID", regex=r"^\d{4}\.\d{4,5}(v\d+)?$"),
+    response: Response,
+    paper_id: str = Path(..., description="arXiv paper ID", pattern=ARXIV_ID_PATTERN),
     num_cards: int = Query(default=15, ge=5, le=50, description="Number of flashcards to generate"),
     topics: Optional[str] = Query(default=None, description="Comma-separated list of topics to focus on"),
 ):
@@ -284,10 +286,12 @@ async def regenerate_flashcards(
         flashcard_service=flashcard_service,
         opensearch=opensearch,
         db=db,
+        response=response,
         paper_id=paper_id,
         num_cards=num_cards,
         topics=topics,
         force_refresh=True,
+        if_none_match=None,
     )
 
 
@@ -4,6 +4,9 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+# arXiv identifier, e.g. 2401.00001 or 2401.00001v1; shared by every router path parameter
+ARXIV_ID_PATTERN = r"^\d{4}\.\d{4,5}(?:v\d+)?$"
+
 
 class ArxivPaper(BaseModel):
     """Schema for arXiv API response data."""
@@ -52,24 +55,14 @@ class PaperCreate(PaperBase):
         None, description="When PDF was processed")
 
 
-class PaperResponse(PaperBase):
-    """Schema for paper API responses with all content."""
+class PaperSummaryResponse(PaperBase):
+    """Schema for paper listings: metadata and processing status, without parsed content."""
 
     id: UUID
 
-    # Parsed PDF content (optional fields)
-    raw_text: Optional[str] = Field(
-        None, description="Full raw text extracted from PDF")
-    sections: Optional[List[Dict[str, Any]]] = Field(
-        None, description="List of sections with titles and content")
-    references: Optional[List[Dict[str, Any]]] = Field(
-        None, description="List of references if extracted")
-
     # PDF processing metadata
     parser_used: Optional[str] = Field(
         None, description="Which parser was used")
-    parser_metadata: Optional[Dict[str, Any]] = Field(
-        None, description="Additional parser metadata")
     pdf_processed: bool = Field(
         False, description="Whether PDF was successfully processed")
     pdf_processing_date: Optional[datetime] = Field(
@@ -83,6 +76,20 @@ class PaperResponse(PaperBase):
         from_attributes = True
 
 
+class PaperResponse(PaperSummaryResponse):
+    """Schema for paper API responses with all content."""
+
+    # Parsed PDF content (optional fields)
+    raw_text: Optional[str] = Field(
+        None, description="Full raw text extracted from PDF")
+    sections: Optional[List[Dict[str, Any]]] = Field(
+        None, description="List of sections with titles and content")
+    references: Optional[List[Dict[str, Any]]] = Field(
+        None, description="List of references if extracted")
+    parser_metadata: Optional[Dict[str, Any]] = Field(
+        None, description="Additional parser metadata")
+
+
 class PaperSearchFilters(BaseModel):
     query: Optional[str] = None
     categories: Optional[List[str]] = None
@@ -92,5 +99,5 @@ class PaperSearchFilters(BaseModel):
 
 
 class PaperSearchResponse(BaseModel):
-    papers: List[PaperResponse]
+    papers: List[PaperSummaryResponse]
     total: int
@@ -11,6 +11,8 @@ class PostgreSQLSettings(BaseSettings):
     echo_sql: bool = Field(default=False, description="Enable SQL query logging")
     pool_size: int = Field(default=20, description="Database connection pool size")
     max_overflow: int = Field(default=0, description="Maximum pool overflow")
+    pool_recycle: int = Field(default=1800, description="Seconds before a pooled connection is recycled")
+    pool_timeout: int = Field(default=5, description="Seconds to wait for a free pooled connection")
 
     class Config:
         env_prefix = "POSTGRES_"
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import orjson
 from pydantic import BaseModel
 from typing import Literal
 from datetime import datetime
@@ -22,6 +23,13 @@ class MindMapNode(BaseModel):
 
     model_config = {"arbitrary_types_allowed": True}
 
+    @classmethod
+    def load_trusted(cls, data: dict) -> MindMapNode:
+        """Build a node tree from data we serialized ourselves, skipping validation."""
+        return cls.model_construct(
+            **{**data, "children": [cls.load_trusted(child) for child in data.get("children", [])]}
+        )
+
 
 MindMapNode.model_rebuild()
 
@@ -35,13 +43,34 @@ class MindMap(BaseModel):
     generated_at: datetime
     model_used: str
 
+    @classmethod
+    def load_trusted(cls, data: dict) -> MindMap:
+        """
+        Build a mind map from data we serialized ourselves (e.g. the Redis cache), skipping validation.
+
+        Untrusted input such as LLM output must still go through model_validate.
+        """
+        return cls.model_construct(
+            **{
+                **data,
+                "root": MindMapNode.load_trusted(data["root"]),
+                "generated_at": datetime.fromisoformat(data["generated_at"]),
+            }
+        )
+
 
 class MindMapCacheEntry(BaseModel):
     mindmap: MindMap
     cache_version: int = 1
     hit_count: int = 0
-    cached_at: datetime
-    expires_at: datetime
+    cached_at: int                       # epoch seconds; converted to datetime only in MindMapCacheStatus
+    expires_at: int
+
+    @classmethod
+    def load_trusted(cls, raw: str | bytes) -> MindMapCacheEntry:
+        """Parse a cache entry written by MindMapCache without re-validating the tree."""
+        data = orjson.loads(raw)
+        return cls.model_construct(**{**data, "mindmap": MindMap.load_trusted(data["mindmap"])})
 
 
 class MindMapCacheStatus(BaseModel):
@@ -0,0 +1,71 @@
+import threading
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _lazy_service(Generic[T]):
+    """``cached_property`` with a lock around the first build.
+
+    Sync dependencies run in the threadpool, so two requests can reach an
+    unbuilt service at the same time; only one of them constructs it.
+    """
+
+    def __init__(self, build: Callable[["ServiceContainer"], T]):
+        self._build = build
+        self._lock = threading.Lock()
+        self.__doc__ = build.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: "ServiceContainer | None", owner: type | None = None):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self._name]
+        except KeyError:
+            pass
+        with self._lock:
+            if self._name not in instance.__dict__:
+                instance.__dict__[self._name] = self._build(instance)
+            return instance.__dict__[self._name]
+
+
+class ServiceContainer:
+    """Service clients that are only built on first use.
+
+    Startup eagerly connects what the health check needs (database, Redis,
+    OpenSearch); everything here is constructed, and its module imported, the
+    first time a request depends on it.
+    """
+
+    @_lazy_service
+    def arxiv_client(self):
+        from src.services.arxiv.factory import make_arxiv_client
+
+        return make_arxiv_client()
+
+    @_lazy_service
+    def pdf_parser(self):
+        from src.services.pdf_parser.factory import make_pdf_parser_service
+
+        return make_pdf_parser_service()
+
+    @_lazy_service
+    def embeddings_service(self):
+        from src.services.embeddings.factory import make_embeddings_service
+
+        return make_embeddings_service()
+
+    @_lazy_service
+    def nvidia_client(self):
+        from src.services.nvidia.factory import make_nvidia_client
+
+        return make_nvidia_client()
+
+    @_lazy_service
+    def mindmap_client(self):
+        from src.services.visualization.mindmaps.factory import get_mindmap_service
+
+        return get_mindmap_service()
@@ -1,9 +1,12 @@
 import asyncio
+import base64
 import logging
+import random
 from typing import List, Optional
-from concurrent.futures import ThreadPoolExecutor
 
-from openai import OpenAI
+import httpx
+import numpy as np
+from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
@@ -19,36 +22,43 @@ class NIMEmbeddingsClient:
         base_url: str = "https://integrate.api.nvidia.com/v1",
         model: str = "nvidia/llama-3.2-nemoretriever-1b-vlm-embed-v1",
         embedding_dim: Optional[int] = None,
-        max_workers: int = 4,
+        max_connections: int = 100,
+        max_inflight: int = 8,
     ):
         """
         :param api_key: NVIDIA API key
         :param base_url: NVIDIA NIM base URL
         :param model: Embedding model name
         :param embedding_dim: Optional sanity check
-        :param max_workers: Thread pool size for async compatibility
+        :param max_connections: Upper bound on concurrent HTTP connections to the endpoint
+        :param max_inflight: Maximum embedding batches in flight at once per embed_passages call
         """
         self.model = model
         self.embedding_dim = embedding_dim
+        self.max_inflight = max_inflight
 
-        self.client = OpenAI(
+        # Native async client: requests are awaited on the event loop instead of parked on worker threads
+        self.client = AsyncOpenAI(
             api_key=api_key,
             base_url=base_url,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            ),
         )
-
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
         logger.info("NVIDIA NIM embeddings client initialized")
 
-    # Internal sync call
-    def _embed_sync(
+    # Internal call
+    async def _embed(
         self,
         inputs: List[str],
         input_type: str,
-    ) -> List[List[float]]:
-        response = self.client.embeddings.create(
+    ) -> np.ndarray:
+        # base64 ships each vector as packed float32 bytes: smaller on the wire and no per-float parsing
+        response = await self.client.embeddings.create(
             model=self.model,
             input=inputs,
-            encoding_format="float",
+            encoding_format="base64",
             extra_body={
               "modality": ["text"] * len(inputs),
               "input_type": input_type,
@@ -56,14 +66,15 @@ class NIMEmbeddingsClient:
             },
         )
 
-        embeddings = [item.embedding for item in response.data]
+        rows = [np.frombuffer(base64.b64decode(item.embedding), dtype=np.float32) for item in response.data]
+        embeddings = np.empty((len(rows), len(rows[0]) if rows else 0), dtype=np.float32)
+        for i, row in enumerate(rows):
+            embeddings[i] = row
 
-        if self.embedding_dim is not None:
-            for emb in embeddings:
-                if len(emb) != self.embedding_dim:
-                    raise ValueError(
-                        f"Expected embedding dim {self.embedding_dim}, got {len(emb)}"
-                    )
+        if self.embedding_dim is not None and embeddings.shape[1] != self.embedding_dim:
+            raise ValueError(
+                f"Expected embedding dim {self.embedding_dim}, got {embeddings.shape[1]}"
+            )
 
         return embeddings
 
@@ -72,47 +83,52 @@ class NIMEmbeddingsClient:
         self,
         texts: List[str],
         batch_size: int = 100,
-    ) -> List[List[float]]:
+    ) -> np.ndarray:
         """
         Embed text passages for indexing.
-        """
-        loop = asyncio.get_running_loop()
-        embeddings: List[List[float]] = []
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-
-            try:
-                batch_embeddings = await loop.run_in_executor(
-                    self.executor,
-                    self._embed_sync,
-                    batch,
-                    "passage",
-                )
-                embeddings.extend(batch_embeddings)
 
+        :returns: array of shape (len(texts), embedding_dim), rows in input order
+        """
+        if not texts:
+            return np.empty((0, self.embedding_dim or 0), dtype=np.float32)
+
+        # Batch passages of similar length together so no batch is padded out to one long outlier
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_texts = [texts[i] for i in order]
+        batches = [sorted_texts[i : i + batch_size] for i in range(0, len(sorted_texts), batch_size)]
+        semaphore = asyncio.Semaphore(self.max_inflight)
+
+        async def run(batch: List[str]) -> np.ndarray:
+            async with semaphore:
+                # Small jitter so a burst of batches does not hit the endpoint in lockstep (429s)
+                await asyncio.sleep(random.random() * 0.02)
+                batch_embeddings = await self._embed(batch, "passage")
                 logger.debug(f"Embedded batch of {len(batch)} passages")
+                return batch_embeddings
 
-            except Exception as e:
-                logger.error(f"Error embedding passages: {e}")
-                raise
+        try:
+            # gather preserves input order, so results line up with the batches
+            results = await asyncio.gather(*(run(batch) for batch in batches))
+        except Exception as e:
+            logger.error(f"Error embedding passages: {e}")
+            raise
+
+        # Scatter back into the caller's order
+        sorted_embeddings = np.concatenate(results)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
 
         logger.info(f"Successfully embedded {len(texts)} passages")
         return embeddings
 
-    async def embed_query(self, query: str) -> List[float]:
+    async def embed_query(self, query: str) -> np.ndarray:
         """
         Embed a search query.
-        """
-        loop = asyncio.get_running_loop()
 
+        :returns: 1-D float32 array
+        """
         try:
-            embedding = await loop.run_in_executor(
-                self.executor,
-                self._embed_sync,
-                [query],
-                "query",
-            )
+            embedding = await self._embed([query], "query")
             return embedding[0]
 
         except Exception as e:
@@ -121,7 +137,7 @@ class NIMEmbeddingsClient:
 
     # Lifecycle
     async def close(self):
-        self.executor.shutdown(wait=False)
+        await self.client.close()
 
     async def __aenter__(self):
         return self
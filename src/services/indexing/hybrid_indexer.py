@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.services.embeddings.jina_client import JinaEmbeddingsClient
 from src.services.opensearch.client import OpenSearchClient
@@ -18,31 +19,39 @@ class HybridIndexingService:
     3. Indexing chunks with embeddings into OpenSearch
     """
 
-    def __init__(self, chunker: TextChunker, embeddings_client: JinaEmbeddingsClient, opensearch_client: OpenSearchClient):
+    def __init__(
+        self,
+        chunker: TextChunker,
+        embeddings_client: JinaEmbeddingsClient,
+        opensearch_client: OpenSearchClient,
+        max_concurrent_papers: int = 8,
+    ):
         """Initialize hybrid indexing service.
 
         :param chunker: Text chunking service
         :param embeddings_client: Embeddings generation client
         :param opensearch_client: OpenSearch client
+        :param max_concurrent_papers: Maximum number of papers chunked and embedded concurrently
         """
         self.chunker = chunker
         self.embeddings_client = embeddings_client
         self.opensearch_client = opensearch_client
+        self.max_concurrent_papers = max_concurrent_papers
 
         logger.info("Hybrid indexing service initialized")
 
-    async def index_paper(self, paper_data: Dict) -> Dict[str, int]:
-        """Index a single paper with chunking and embeddings.
+    async def _prepare_paper_chunks(self, paper_data: Dict) -> Tuple[List[Dict], Dict[str, int]]:
+        """Chunk and embed a single paper without indexing it.
 
         :param paper_data: Paper data from database
-        :returns: Dictionary with indexing statistics
+        :returns: Tuple of (chunks with embeddings ready for bulk indexing, statistics)
         """
         arxiv_id = paper_data.get("arxiv_id")
         paper_id = str(paper_data.get("id", ""))
 
         if not arxiv_id:
             logger.error("Paper missing arxiv_id")
-            return {"chunks_created": 0, "chunks_indexed": 0, "embeddings_generated": 0, "errors": 1}
+            return [], {"chunks_created": 0, "embeddings_generated": 0, "errors": 1}
 
         try:
             # Step 1: Chunk the paper using hybrid section-based approach
@@ -57,7 +66,7 @@ class HybridIndexingService:
 
             if not chunks:
                 logger.warning(f"No chunks created for paper {arxiv_id}")
-                return {"chunks_created": 0, "chunks_indexed": 0, "embeddings_generated": 0, "errors": 0}
+                return [], {"chunks_created": 0, "embeddings_generated": 0, "errors": 0}
 
             logger.info(f"Created {len(chunks)} chunks for paper {arxiv_id}")
 
@@ -70,44 +79,66 @@ class HybridIndexingService:
 
             if len(embeddings) != len(chunks):
                 logger.error(f"Embedding count mismatch: {len(embeddings)} != {len(chunks)}")
-                return {"chunks_created": len(chunks), "chunks_indexed": 0, "embeddings_generated": len(embeddings), "errors": 1}
+                return [], {"chunks_created": len(chunks), "embeddings_generated": len(embeddings), "errors": 1}
 
             # Step 3: Prepare chunks with embeddings for indexing
-            chunks_with_embeddings = []
-
-            for chunk, embedding in zip(chunks, embeddings):
-                # Prepare chunk data for OpenSearch
-                chunk_data = {
-                    "arxiv_id": chunk.arxiv_id,
-                    "paper_id": chunk.paper_id,
-                    "chunk_index": chunk.metadata.chunk_index,
-                    "chunk_text": chunk.text,
-                    "chunk_word_count": chunk.metadata.word_count,
-                    "start_char": chunk.metadata.start_char,
-                    "end_char": chunk.metadata.end_char,
-                    "section_title": chunk.metadata.section_title,
-                    "embedding_model": "jina-embeddings-v3",
-                    # Denormalized paper metadata for efficient search
-                    "title": paper_data.get("title", ""),
-                    "authors": ", ".join(paper_data.get("authors", []))
-                    if isinstance(paper_data.get("authors"), list)
-                    else paper_data.get("authors", ""),
-                    "abstract": paper_data.get("abstract", ""),
-                    "categories": paper_data.get("categories", []),
-                    "published_date": paper_data.get("published_date"),
+            # Denormalized paper metadata is identical for every chunk, so build it once per paper
+            authors = paper_data.get("authors", [])
+            paper_metadata = {
+                "embedding_model": "jina-embeddings-v3",
+                "title": paper_data.get("title", ""),
+                "authors": ", ".join(authors) if isinstance(authors, list) else authors or "",
+                "abstract": paper_data.get("abstract", ""),
+                "categories": paper_data.get("categories", []),
+                "published_date": paper_data.get("published_date"),
+            }
+
+            chunks_with_embeddings = [
+                {
+                    "chunk_data": {
+                        "arxiv_id": chunk.arxiv_id,
+                        "paper_id": chunk.paper_id,
+                        "chunk_index": chunk.metadata.chunk_index,
+                        "chunk_text": chunk.text,
+                        "chunk_word_count": chunk.metadata.word_count,
+                        "start_char": chunk.metadata.start_char,
+                        "end_char": chunk.metadata.end_char,
+                        "section_title": chunk.metadata.section_title,
+                        **paper_metadata,
+                    },
+                    "embedding": embedding,
                 }
+                for chunk, embedding in zip(chunks, embeddings)
+            ]
+
+            return chunks_with_embeddings, {"chunks_created": len(chunks), "embeddings_generated": len(embeddings), "errors": 0}
+
+        except Exception as e:
+            logger.error(f"Error preparing paper {arxiv_id}: {e}")
+            return [], {"chunks_created": 0, "embeddings_generated": 0, "errors": 1}
+
+    async def index_paper(self, paper_data: Dict) -> Dict[str, int]:
+        """Index a single paper with chunking and embeddings.
+
+        :param paper_data: Paper data from database
+        :returns: Dictionary with indexing statistics
+        """
+        arxiv_id = paper_data.get("arxiv_id")
+        chunks_with_embeddings, stats = await self._prepare_paper_chunks(paper_data)
 
-                chunks_with_embeddings.append({"chunk_data": chunk_data, "embedding": embedding})
+        if not chunks_with_embeddings:
+            return {"chunks_indexed": 0, **stats}
 
+        try:
             # Step 4: Index chunks into OpenSearch
             results = self.opensearch_client.bulk_index_chunks(chunks_with_embeddings)
 
             logger.info(f"Indexed paper {arxiv_id}: {results['success']} chunks successful, {results['failed']} failed")
 
             return {
-                "chunks_created": len(chunks),
+                "chunks_created": stats["chunks_created"],
                 "chunks_indexed": results["success"],
-                "embeddings_generated": len(embeddings),
+                "embeddings_generated": stats["embeddings_generated"],
                 "errors": results["failed"],
             }
 
@@ -118,6 +149,11 @@ class HybridIndexingService:
     async def index_papers_batch(self, papers: List[Dict], replace_existing: bool = False) -> Dict[str, int]:
         """Index multiple papers in batch.
 
+        Papers are chunked and embedded concurrently (bounded by
+        ``max_concurrent_papers``), then chunks from every paper are sent through
+        a single streamed ``_bulk`` request sequence, so the number of HTTP
+        round-trips and index refreshes no longer grows with the number of papers.
+
         :param papers: List of paper data
         :param replace_existing: If True, delete existing chunks before indexing
         :returns: Aggregated statistics
@@ -130,23 +166,48 @@ class HybridIndexingService:
             "total_errors": 0,
         }
 
-        for paper in papers:
-            arxiv_id = paper.get("arxiv_id")
+        semaphore = asyncio.Semaphore(self.max_concurrent_papers)
 
-            # Optionally delete existing chunks
-            if replace_existing and arxiv_id:
-                self.opensearch_client.delete_paper_chunks(arxiv_id)
+        async def _prepare(paper: Dict) -> Tuple[List[Dict], Dict[str, int]]:
+            async with semaphore:
+                arxiv_id = paper.get("arxiv_id")
 
-            # Index the paper
-            stats = await self.index_paper(paper)
+                # Optionally delete existing chunks
+                if replace_existing and arxiv_id:
+                    await asyncio.to_thread(self.opensearch_client.delete_paper_chunks, arxiv_id)
 
-            # Update totals
+                # Chunk and embed the paper; indexing happens once for the whole batch
+                return await self._prepare_paper_chunks(paper)
+
+        results = await asyncio.gather(*(_prepare(paper) for paper in papers), return_exceptions=True)
+
+        pending_chunks: List[Dict] = []
+
+        for paper, result in zip(papers, results):
             total_stats["papers_processed"] += 1
+
+            if isinstance(result, BaseException):
+                logger.error(f"Error preparing paper {paper.get('arxiv_id')}: {result}")
+                total_stats["total_errors"] += 1
+                continue
+
+            chunks_with_embeddings, stats = result
+            pending_chunks.extend(chunks_with_embeddings)
+
+            # Update totals
             total_stats["total_chunks_created"] += stats["chunks_created"]
-            total_stats["total_chunks_indexed"] += stats["chunks_indexed"]
             total_stats["total_embeddings_generated"] += stats["embeddings_generated"]
             total_stats["total_errors"] += stats["errors"]
 
+        if pending_chunks:
+            try:
+                results = self.opensearch_client.bulk_index_chunks(pending_chunks)
+                total_stats["total_chunks_indexed"] += results["success"]
+                total_stats["total_errors"] += results["failed"]
+            except Exception as e:
+                logger.error(f"Error bulk indexing {len(pending_chunks)} chunks: {e}")
+                total_stats["total_errors"] += len(pending_chunks)
+
         logger.info(
             f"Batch indexing complete: {total_stats['papers_processed']} papers, "
             f"{total_stats['total_chunks_indexed']} chunks indexed"
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from concurrent.futures import Executor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -14,7 +15,7 @@ from src.schemas.arxiv.paper import ArxivPaper, PaperCreate
 from src.schemas.pdf_parser.models import ArxivMetadata, ParsedPaper, PdfContent
 from src.services.arxiv.client import ArxivClient
 from src.services.opensearch.client import OpenSearchClient
-from src.services.pdf_parser.parser import PDFParserService
+from src.services.pdf_parser.parser import PDFParserService, get_parse_executor, parse_pdf_in_worker
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,7 @@ class MetadataFetcher:
         pdf_cache_dir: Optional[Path] = None,
         max_concurrent_downloads: int = 5,
         max_concurrent_parsing: int = 3,
+        parse_workers: int = 1,
         settings: Optional[Settings] = None,
     ):
         """
@@ -67,6 +69,7 @@ class MetadataFetcher:
             pdf_cache_dir: Directory for PDF caching (uses client default if None)
             max_concurrent_downloads: Maximum concurrent PDF downloads
             max_concurrent_parsing: Maximum concurrent PDF parsing operations
+            parse_workers: Number of worker processes for PDF parsing (1 parses in-process)
             settings: Application settings config
         """
         from src.config import get_settings
@@ -75,6 +78,7 @@ class MetadataFetcher:
         self.pdf_cache_dir = pdf_cache_dir or self.arxiv_client.pdf_cache_dir
         self.max_concurrent_downloads = max_concurrent_downloads
         self.max_concurrent_parsing = max_concurrent_parsing
+        self.parse_workers = parse_workers
         self.settings = settings or get_settings()
 
     async def fetch_and_process_papers(
@@ -85,6 +89,7 @@ class MetadataFetcher:
         process_pdfs: bool = True,
         store_to_db: bool = True,
         db_session: Optional[Session] = None,
+        parse_workers: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Fetch papers from arXiv, process PDFs, and store to database.
@@ -96,6 +101,7 @@ class MetadataFetcher:
             process_pdfs: Whether to download and parse PDFs
             store_to_db: Whether to store results in database
             db_session: Database session (required if store_to_db=True)
+            parse_workers: Override for the number of PDF parse worker processes
 
         Returns:
             Dictionary with processing results and statistics
@@ -127,7 +133,7 @@ class MetadataFetcher:
             # Step 2: Process PDFs if requested
             pdf_results = {}
             if process_pdfs:
-                pdf_results = await self._process_pdfs_batch(papers)
+                pdf_results = await self._process_pdfs_batch(papers, parse_workers or self.parse_workers)
                 results["pdfs_downloaded"] = pdf_results["downloaded"]
                 results["pdfs_parsed"] = pdf_results["parsed"]
                 results["errors"].extend(pdf_results["errors"])
@@ -170,7 +176,7 @@ class MetadataFetcher:
             results["errors"].append(f"Pipeline error: {str(e)}")
             raise PipelineException(f"Pipeline execution failed: {e}") from e
 
-    async def _process_pdfs_batch(self, papers: List[ArxivPaper]) -> Dict[str, Any]:
+    async def _process_pdfs_batch(self, papers: List[ArxivPaper], parse_workers: int = 1) -> Dict[str, Any]:
         """
         Process PDFs for a batch of papers with async concurrency.
 
@@ -181,8 +187,12 @@ class MetadataFetcher:
 
         This is optimal for production workloads like 100 papers/day.
 
+        When parse_workers > 1, Docling parsing runs in a shared, long-lived process pool so
+        CPU-bound parses proceed in parallel instead of blocking the event loop.
+
         Args:
             papers: List of ArxivPaper objects
+            parse_workers: Number of worker processes for PDF parsing
 
         Returns:
             Dictionary with processing results and statistics
@@ -198,15 +208,24 @@ class MetadataFetcher:
 
         logger.info(f"Starting async pipeline for {len(papers)} PDFs...")
         logger.info(f"Concurrent downloads: {self.max_concurrent_downloads}")
-        logger.info(f"Concurrent parsing: {self.max_concurrent_parsing}")
+        # No point spawning (and loading Docling in) more workers than there are PDFs
+        parse_workers = max(1, min(parse_workers, len(papers)))
+        parse_executor = None
+        if parse_workers > 1:
+            parse_executor = get_parse_executor(parse_workers, self.pdf_parser.options)
+            logger.info(f"Parse worker processes: {parse_workers}")
+        else:
+            logger.info(f"Concurrent parsing: {self.max_concurrent_parsing}")
 
         # Create semaphores for controlled concurrency
         download_semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
-        parse_semaphore = asyncio.Semaphore(self.max_concurrent_parsing)
+        parse_semaphore = asyncio.Semaphore(parse_workers if parse_executor else self.max_concurrent_parsing)
 
         # Start all download+parse pipelines concurrently
-        pipeline_tasks = [self._download_and_parse_pipeline(
-            paper, download_semaphore, parse_semaphore) for paper in papers]
+        pipeline_tasks = [
+            self._download_and_parse_pipeline(paper, download_semaphore, parse_semaphore, parse_executor)
+            for paper in papers
+        ]
 
         # Wait for all pipelines to complete
         pipeline_results = await asyncio.gather(*pipeline_tasks, return_exceptions=True)
@@ -270,7 +289,11 @@ class MetadataFetcher:
         return results
 
     async def _download_and_parse_pipeline(
-        self, paper: ArxivPaper, download_semaphore: asyncio.Semaphore, parse_semaphore: asyncio.Semaphore
+        self,
+        paper: ArxivPaper,
+        download_semaphore: asyncio.Semaphore,
+        parse_semaphore: asyncio.Semaphore,
+        parse_executor: Optional[Executor] = None,
     ) -> tuple:
         """
         Complete download+parse pipeline for a single paper with true parallelism.
@@ -299,7 +322,13 @@ class MetadataFetcher:
             # This allows other downloads to continue while this PDF is being parsed
             async with parse_semaphore:
                 logger.debug(f"Starting parse: {paper.arxiv_id}")
-                pdf_content = await self.pdf_parser.parse_pdf(pdf_path)
+                if parse_executor:
+                    loop = asyncio.get_running_loop()
+                    pdf_content = await loop.run_in_executor(
+                        parse_executor, parse_pdf_in_worker, pdf_path, self.pdf_parser.options
+                    )
+                else:
+                    pdf_content = await self.pdf_parser.parse_pdf(pdf_path)
 
                 if pdf_content:
                     # Create ArxivMetadata from the paper
@@ -382,7 +411,7 @@ class MetadataFetcher:
         """
 
         paper_repo = PaperRepository(db_session)
-        stored_count = 0
+        papers_to_store = []
 
         for paper in papers:
             try:
@@ -426,28 +455,24 @@ class MetadataFetcher:
                     logger.debug(f"Storing paper {
                         paper.arxiv_id} with metadata only")
 
-                paper_create = PaperCreate(**paper_data)
-                stored_paper = paper_repo.upsert(paper_create)
-
-                if stored_paper:
-                    stored_count += 1
-                    content_info = "with parsed content" if parsed_paper else "metadata only"
-                    logger.debug(f"Stored paper {
-                                 paper.arxiv_id} to database ({content_info})")
+                papers_to_store.append(PaperCreate(**paper_data))
 
             except Exception as e:
-                logger.error(f"Failed to store paper {paper.arxiv_id}: {e}")
-                db_session.rollback()  # 🔴 REQUIRED
+                logger.error(f"Failed to prepare paper {paper.arxiv_id}: {e}")
                 continue
-        # Commit all changes
+
+        if not papers_to_store:
+            return 0
+
+        # Upsert all papers in batched statements and commit once
         try:
+            stored_count = paper_repo.bulk_upsert(papers_to_store)
             db_session.commit()
             logger.info(
                 f"Committed {stored_count} papers to database with full content storage")
         except Exception as e:
             logger.error(f"Failed to commit papers to database: {e}")
             db_session.rollback()
-            stored_count = 0
             return 0
 
         return stored_count
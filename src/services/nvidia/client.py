@@ -1,9 +1,14 @@
+import hashlib
 import json
 import logging
-import traceback
-from typing import Any, Dict, Generator, List, Optional
-
-from openai import APIConnectionError, APITimeoutError, OpenAI, OpenAIError
+import ssl
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+import httpx
+import orjson
+from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, OpenAI, OpenAIError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 from src.config import get_settings
 from src.exceptions import OllamaConnectionError, OllamaException, OllamaTimeoutError
 from src.schemas.nvidia import RAGResponse
@@ -17,6 +22,21 @@ from src.services.nvidia.prompts import (
 
 logger = logging.getLogger(__name__)
 
+# Building an SSLContext loads the CA bundle from disk; do it once and share it across HTTP clients
+_SSL_CONTEXT = ssl.create_default_context()
+
+# Builders only hold the system prompt and budget; share one of each across client instances
+_RAG_PROMPT_BUILDER = RAGPromptBuilder()
+_MINDMAP_PROMPT_BUILDER = MindMapPromptBuilder()
+_FLASHCARD_PROMPT_BUILDER = FlashcardPromptBuilder()
+
+RAG_ANSWER_KEY_PREFIX = "rag_answer"
+
+
+def _rag_answer_key(model: str, prompt: str) -> str:
+    digest = hashlib.blake2b(f"{model}|{prompt}".encode(), digest_size=16).hexdigest()
+    return f"{RAG_ANSWER_KEY_PREFIX}:{digest}"
+
 
 class NvidiaClient:
     """Client for NVIDIA-hosted OpenAI-compatible API (meta/llama-3.3-70b-instruct)."""
@@ -24,20 +44,42 @@ class NvidiaClient:
     def __init__(self):
         """Initialize OpenAI client with NVIDIA endpoint and API key."""
         settings = get_settings()
-        self.client = OpenAI(api_key=settings.nvidia_api_key, base_url=settings.nvidia_base_url)
-        self.prompt_builder = RAGPromptBuilder()
-        self.response_parser = ResponseParser()
-        self.mindmap_prompt_builder = MindMapPromptBuilder()
-        self.flashcard_prompt_builder = FlashcardPromptBuilder()
         self.timeout = float(settings.nvidia_timeout)
+        timeout = httpx.Timeout(self.timeout, connect=10.0)
+        self.client = OpenAI(
+            api_key=settings.nvidia_api_key,
+            base_url=settings.nvidia_base_url,
+            # The SDK retries 408/409/429/5xx and dropped connections with jittered exponential backoff
+            max_retries=settings.nvidia_max_retries,
+            http_client=httpx.Client(
+                verify=_SSL_CONTEXT,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+                timeout=timeout,
+            ),
+        )
+        # Async client for calls made from the event loop; one keep-alive pool shared by all requests
+        self.aclient = AsyncOpenAI(
+            api_key=settings.nvidia_api_key,
+            base_url=settings.nvidia_base_url,
+            max_retries=settings.nvidia_max_retries,
+            http_client=httpx.AsyncClient(
+                verify=_SSL_CONTEXT,
+                limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+                timeout=timeout,
+            ),
+        )
+        self.prompt_builder = _RAG_PROMPT_BUILDER
+        self.mindmap_prompt_builder = _MINDMAP_PROMPT_BUILDER
+        self.flashcard_prompt_builder = _FLASHCARD_PROMPT_BUILDER
         self.default_model = "meta/llama-3.3-70b-instruct"
+        self.rag_answer_ttl = settings.redis_rag_answer_ttl_seconds
 
     def health_check(self) -> Dict[str, Any]:
         """Check if NVIDIA LLM endpoint is reachable."""
         try:
             logger.info("Performing NVIDIA LLM health check...")
             models = self.client.models.list()
-            logger.info(f"NVIDIA LLM endpoint reachable — {len(models.data)} models found.")
+            logger.info("NVIDIA LLM endpoint reachable — %d models found.", len(models.data))
             return {
                 "status": "healthy",
                 "message": "NVIDIA LLM endpoint reachable",
@@ -45,38 +87,26 @@ class NvidiaClient:
             }
 
         except APIConnectionError as e:
-            tb = traceback.format_exc()
-            logger.error(
-                f"[LLM ERROR] Connection to NVIDIA API failed.\n"
-                f"Base URL: {self.client.base_url}\n"
-                f"Exception Type: {type(e).__name__}\n"
-                f"Details: {e}\n"
-                f"Traceback:\n{tb}"
-            )
+            # logger.exception attaches the traceback; message and traceback are only formatted if the record is emitted
+            logger.exception("[LLM ERROR] Connection to NVIDIA API failed. Base URL: %s", self.client.base_url)
             raise OllamaConnectionError(f"Cannot connect to LLM service: {e}") from e
 
         except APITimeoutError as e:
-            tb = traceback.format_exc()
-            logger.error(
-                f"[LLM ERROR] NVIDIA API timeout.\n"
-                f"Base URL: {self.client.base_url}\n"
-                f"Timeout: {self.timeout}s\n"
-                f"Details: {e}\n"
-                f"Traceback:\n{tb}"
-            )
+            logger.exception("[LLM ERROR] NVIDIA API timeout. Base URL: %s, timeout: %ss", self.client.base_url, self.timeout)
             raise OllamaTimeoutError(f"LLM service timeout: {e}") from e
 
         except Exception as e:
-            tb = traceback.format_exc()
-            logger.error(
-                f"[LLM ERROR] Unexpected failure during NVIDIA health check.\n"
-                f"Base URL: {self.client.base_url}\n"
-                f"Exception Type: {type(e).__name__}\n"
-                f"Details: {e}\n"
-                f"Traceback:\n{tb}"
-            )
+            logger.exception("[LLM ERROR] Unexpected failure during NVIDIA health check. Base URL: %s", self.client.base_url)
             raise OllamaException(f"Health check failed: {e}") from e
 
+    async def prewarm(self) -> None:
+        """Open a keep-alive connection on the async client so the first request skips the TLS handshake."""
+        try:
+            await self.aclient.models.list()
+            logger.info("NVIDIA LLM connection pool warmed")
+        except Exception as e:
+            logger.warning("NVIDIA LLM prewarm failed, first request will connect cold: %s", e)
+
     def list_models(self) -> List[Dict[str, Any]]:
         """List available models."""
         try:
@@ -85,7 +115,7 @@ class NvidiaClient:
         except Exception as e:
             raise OllamaException(f"Error listing models: {e}")
 
-    def generate(
+    async def generate(
         self,
         model: Optional[str] = None,
         prompt: Optional[str] = None,
@@ -95,12 +125,12 @@ class NvidiaClient:
         """Generate text using the specified model."""
         try:
             model = model or self.default_model
-            logger.info(f"Sending request to LLM: model={model}, stream={stream}")
+            logger.info("Sending request to LLM: model=%s, stream=%s", model, stream)
 
             if stream:
                 raise OllamaException("Use generate_stream() for streaming responses")
 
-            completion = self.client.chat.completions.create(
+            completion = await self.aclient.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=kwargs.get("temperature", 0.7),
@@ -119,30 +149,30 @@ class NvidiaClient:
         except Exception as e:
             raise OllamaException(f"Generation failed: {e}")
 
-    def generate_stream(
+    async def generate_stream(
         self,
         model: Optional[str] = None,
         prompt: Optional[str] = None,
         **kwargs,
-    ) -> Generator[Dict[str, Any], None, None]:
-        """Stream generation results incrementally."""
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream generation results incrementally, one event per content delta."""
         try:
             model = model or self.default_model
-            logger.info(f"Starting streaming generation: model={model}")
+            logger.info("Starting streaming generation: model=%s", model)
 
-            with self.client.chat.completions.stream(
+            async with self.aclient.chat.completions.stream(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=kwargs.get("temperature", 0.7),
                 top_p=kwargs.get("top_p", 0.9),
                 max_tokens=kwargs.get("max_tokens", 2048),
             ) as stream:
-                for event in stream:
-                    if event.type == "message":
-                        yield {"response": event.message["content"]}
-                    elif event.type == "error":
-                        logger.error(f"Stream error: {event.error}")
-                        raise OllamaException(event.error)
+                async for event in stream:
+                    # Forward tokens as they arrive rather than waiting for the full message
+                    if event.type == "content.delta":
+                        yield {"response": event.delta}
+
+            yield {"response": "", "done": True}
 
         except APIConnectionError as e:
             raise OllamaConnectionError(f"Cannot connect to LLM stream: {e}")
@@ -151,15 +181,20 @@ class NvidiaClient:
         except Exception as e:
             raise OllamaException(f"Streaming generation failed: {e}")
 
-    def generate_rag_answer(
+    async def generate_rag_answer(
         self,
         query: str,
         chunks: List[Dict[str, Any]],
         model: Optional[str] = None,
         use_structured_output: bool = True,
+        cache: Optional[Redis] = None,
     ) -> Dict[str, Any]:
         """
         Generate a RAG answer using retrieved chunks, with schema-based structured output.
+
+        When a Redis client is passed as ``cache``, answers are cached by (model, prompt) so an
+        identical question over identical chunks skips the LLM call. Only answers that parsed as
+        structured output are cached; the plain-text fallback is retried next time. Pass None to disable.
         """
         try:
             model = model or self.default_model
@@ -167,8 +202,22 @@ class NvidiaClient:
             if use_structured_output:
                 prompt_data = self.prompt_builder.create_structured_prompt(query, chunks)
                 prompt = prompt_data["prompt"]
+            else:
+                prompt = self.prompt_builder.create_rag_prompt(query, chunks)
 
-                response = self.generate(
+            cache_key = _rag_answer_key(model, prompt) if cache is not None else None
+            if cache_key is not None:
+                try:
+                    cached = await cache.get(cache_key)
+                except RedisError as e:
+                    logger.warning("RAG answer cache read failed: %s", e)
+                    cached = None
+                if cached is not None:
+                    logger.info("RAG answer cache hit")
+                    return orjson.loads(cached)
+
+            if use_structured_output:
+                response = await self.generate(
                     model=model,
                     prompt=prompt,
                     temperature=0.7,
@@ -176,8 +225,7 @@ class NvidiaClient:
                     response_format=response_format,
                 )
             else:
-                prompt = self.prompt_builder.create_rag_prompt(query, chunks)
-                response = self.generate(
+                response = await self.generate(
                     model=model,
                     prompt=prompt,
                     temperature=0.7,
@@ -187,47 +235,49 @@ class NvidiaClient:
 
             if response and "response" in response:
                 raw_response = response["response"]
-                logger.debug(f"Raw LLM response: {raw_response[:400]}")
-                parsed_response = self.response_parser.parse_structured_response(raw_response)
+                logger.debug("Raw LLM response: %.400s", raw_response)
+                parsed_response = ResponseParser.parse_structured_response(raw_response)
+                # The parser's last resort wraps the raw text as the answer; never cache that degraded reply
+                structured = parsed_response.get("answer") != raw_response
+
+                # Unique arXiv ids in retrieval order (dict keeps insertion order, unlike set)
+                arxiv_ids = dict.fromkeys(chunk["arxiv_id"] for chunk in chunks if chunk.get("arxiv_id"))
 
                 # Ensure sources exist
                 if not parsed_response.get("sources"):
-                    seen, sources = set(), []
-                    for chunk in chunks:
-                        arxiv_id = chunk.get("arxiv_id")
-                        if arxiv_id:
-                            clean_id = arxiv_id.split("v")[0] if "v" in arxiv_id else arxiv_id
-                            pdf_url = f"https://arxiv.org/pdf/{clean_id}"
-                            if pdf_url not in seen:
-                                sources.append(pdf_url)
-                                seen.add(pdf_url)
-                    parsed_response["sources"] = sources
+                    pdf_urls = (f"https://arxiv.org/pdf/{arxiv_id.split('v', 1)[0]}" for arxiv_id in arxiv_ids)
+                    parsed_response["sources"] = list(dict.fromkeys(pdf_urls))
 
                 # Add citations if missing
                 if not parsed_response.get("citations"):
-                    citations = list(set(chunk.get("arxiv_id") for chunk in chunks if chunk.get("arxiv_id")))
-                    parsed_response["citations"] = citations[:5]
+                    parsed_response["citations"] = list(arxiv_ids)[:5]
+
+                if cache_key is not None and structured:
+                    try:
+                        await cache.set(cache_key, orjson.dumps(parsed_response), ex=self.rag_answer_ttl)
+                    except RedisError as e:
+                        logger.warning("RAG answer cache write failed: %s", e)
 
                 return parsed_response
 
             raise OllamaException("No structured response generated from LLM")
 
         except Exception as e:
-            logger.error(f"Error generating RAG answer: {e}")
+            logger.error("Error generating RAG answer: %s", e)
             raise OllamaException(f"Failed to generate RAG answer: {e}")
 
-    def generate_rag_answer_stream(
+    async def generate_rag_answer_stream(
         self,
         query: str,
         chunks: List[Dict[str, Any]],
         model: Optional[str] = None,
-    ) -> Generator[Dict[str, Any], None, None]:
+    ) -> AsyncGenerator[Dict[str, Any], None]:
         """Stream RAG answers progressively."""
         try:
             model = model or self.default_model
             prompt = self.prompt_builder.create_rag_prompt(query, chunks)
 
-            for chunk in self.generate_stream(
+            async for chunk in self.generate_stream(
                 model=model,
                 prompt=prompt,
                 temperature=0.7,
@@ -236,10 +286,10 @@ class NvidiaClient:
                 yield chunk
 
         except Exception as e:
-            logger.error(f"Error generating streaming RAG answer: {e}")
+            logger.error("Error generating streaming RAG answer: %s", e)
             raise OllamaException(f"Failed to generate streaming RAG answer: {e}")
 
-    def generate_mindmap(self, paper_title, arxiv_id, chunks, model=None):
+    async def generate_mindmap(self, paper_title, arxiv_id, chunks, model=None):
         try:
             model = model or self.default_model
 
@@ -249,9 +299,9 @@ class NvidiaClient:
                 chunks=chunks,
             )
 
-            # Call completions directly without UnstructuredResponse wrapper
+            # Call completions directly without a structured-response wrapper
             # so the LLM outputs raw JSON without being forced into {"answer": "..."}
-            completion = self.client.chat.completions.create(
+            completion = await self.aclient.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
@@ -273,10 +323,10 @@ class NvidiaClient:
         except OllamaException:
             raise
         except Exception as e:
-            logger.error(f"Error generating mind map: {e}")
+            logger.error("Error generating mind map: %s", e)
             raise OllamaException(f"Failed to generate mind map: {e}")
 
-    def generate_flashcards(
+    async def generate_flashcards(
         self,
         paper_title: str,
         paper_abstract: str,
@@ -317,7 +367,7 @@ class NvidiaClient:
                 topics=topics,
             )
 
-            completion = self.client.chat.completions.create(
+            completion = await self.aclient.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,  # Lower temperature for more consistent flashcards
@@ -339,5 +389,5 @@ class NvidiaClient:
         except OllamaException:
             raise
         except Exception as e:
-            logger.error(f"Error generating flashcards: {e}")
+            logger.error("Error generating flashcards: %s", e)
             raise OllamaException(f"Failed to generate flashcards: {e}")
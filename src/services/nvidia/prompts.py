@@ -1,32 +1,43 @@
-import json
 import re
 from collections import defaultdict
-from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ValidationError
+from pydantic import ValidationError
 from src.schemas.nvidia import RAGResponse
 
+response_format = None
 
-class Confidence(str, Enum):
-    low = "low"
-    medium = "medium"
-    high = "high"
+# Outermost {...} span in a response that wraps its JSON in prose
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
 
+# Schema generation walks the model; it never changes at runtime
+_RAG_RESPONSE_SCHEMA = RAGResponse.model_json_schema()
 
-class LLMResponse(BaseModel):
-    answer: str
-    sources: list[str]
-    confidence: Optional[Confidence]
-    citations: Optional[list[str]]
 
+def _project_chunks(chunks: list) -> list[tuple[int, str, str]]:
+    """
+    Project chunks (OpenSearch hit dicts or TextChunk objects) to (chunk_index, section_title, text).
 
-class UnstructuredResponse(BaseModel):
-    answer: str
+    Pulling the three fields out once means sorting and grouping work on plain tuples.
+    A single call never mixes the two chunk types, so the type is checked once for the whole list.
+    """
+    if chunks and isinstance(chunks[0], dict):
+        return [
+            (c["chunk_index"], (c.get("section_title") or "").strip(), c.get("text", c.get("chunk_text", "")))
+            for c in chunks
+        ]
+    return [(c.metadata.chunk_index, (c.metadata.section_title or "").strip(), c.text) for c in chunks]
 
 
-response_format = None
+@lru_cache(maxsize=None)
+def _read_prompt_file(prompt_file: Path) -> Optional[str]:
+    """Read a prompt file once per process; None if it does not exist."""
+    if not prompt_file.exists():
+        return None
+    return prompt_file.read_text().strip()
 
 
 class RAGPromptBuilder:
@@ -43,15 +54,15 @@ class RAGPromptBuilder:
         Returns:
             System prompt string
         """
-        prompt_file = self.prompts_dir / "rag_system.txt"
-        if not prompt_file.exists():
+        prompt = _read_prompt_file(self.prompts_dir / "rag_system.txt")
+        if prompt is None:
             # Fallback to default prompt if file doesn't exist
             return (
                 "You are an AI assistant specialized in answering questions about "
                 "academic papers from arXiv. Base your answer STRICTLY on the provided "
                 "paper excerpts."
             )
-        return prompt_file.read_text().strip()
+        return prompt
 
     def create_rag_prompt(self, query: str, chunks: List[Dict[str, Any]]) -> str:
         """Create a RAG prompt with query and retrieved chunks.
@@ -63,23 +74,16 @@ class RAGPromptBuilder:
         Returns:
             Formatted prompt string
         """
-        prompt = f"{self.system_prompt}\n\n"
-        prompt += "### Context from Papers (do NOT imitate formatting):\n\n"
+        # Collect the pieces and join once; repeated += copies the growing prompt on every chunk
+        parts = [self.system_prompt, "\n\n### Context from Papers (do NOT imitate formatting):\n\n"]
 
-        for i, chunk in enumerate(chunks, 1):
-            # Get the actual chunk text
-            chunk_text = chunk.get("chunk_text", chunk.get("content", ""))
-            arxiv_id = chunk.get("arxiv_id", "")
+        sources = [(chunk.get("arxiv_id", ""), chunk.get("chunk_text", chunk.get("content", ""))) for chunk in chunks]
+        for i, (arxiv_id, chunk_text) in enumerate(sources, 1):
+            parts.append(f"[Source {i} — arXiv:{arxiv_id}]\n```text\n{chunk_text}\n```\n\n")
 
-            prompt += f"[Source {i} — arXiv:{arxiv_id}]\n"
-            prompt += "```text\n"
-            prompt += f"{chunk_text}\n"
-            prompt += "```\n\n"
+        parts.append(f"### Question:\n{query}\n\n### Answer (cite sources using [arXiv:id] format):\n")
 
-        prompt += f"### Question:\n{query}\n\n"
-        prompt += "### Answer (cite sources using [arXiv:id] format):\n"
-
-        return prompt
+        return "".join(parts)
 
     def create_structured_prompt(self, query: str, chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Create a prompt for Ollama with structured output format.
@@ -96,7 +100,7 @@ class RAGPromptBuilder:
         # Return prompt with Pydantic model schema for structured output
         return {
             "prompt": prompt_text,
-            "format": RAGResponse.model_json_schema(),
+            "format": _RAG_RESPONSE_SCHEMA,
         }
 
 
@@ -115,6 +119,14 @@ class MindMapPromptBuilder:
         "disclosure",
     }
 
+    _TEMPLATE = (
+        "{system_prompt}\n\n"
+        "Paper Title: {paper_title}\n"
+        "ArXiv ID: {arxiv_id}\n\n"
+        "Paper Content:\n{sections_block}\n\n"
+        "Generate the conceptual mind map JSON now:"
+    )
+
     def __init__(self, max_chars: int = 32_000):
         self._max_chars = max_chars
         self.prompts_dir = Path(__file__).parent / "prompts"
@@ -126,15 +138,15 @@ class MindMapPromptBuilder:
         Returns:
             System prompt string
         """
-        prompt_file = self.prompts_dir / "mindmap.txt"
-        if not prompt_file.exists():
+        prompt = _read_prompt_file(self.prompts_dir / "mindmap.txt")
+        if prompt is None:
             # Fallback to default prompt if file doesn't exist
             return (
                 "You are an AI assistant specialized in answering questions about "
                 "academic papers from arXiv. Base your answer STRICTLY on the provided "
                 "paper excerpts."
             )
-        return prompt_file.read_text().strip()
+        return prompt
 
     def build_prompt(
         self,
@@ -144,53 +156,42 @@ class MindMapPromptBuilder:
     ) -> str:
         sections = self._assemble_sections(chunks)
         sections_block = "\n\n".join(f"### {title or 'General'}\n{text}" for title, text in sections)
-        return (
-            f"{self.system_prompt}\n\n"
-            f"Paper Title: {paper_title}\n"
-            f"ArXiv ID: {arxiv_id}\n\n"
-            f"Paper Content:\n{sections_block}\n\n"
-            f"Generate the conceptual mind map JSON now:"
+        return self._TEMPLATE.format(
+            system_prompt=self.system_prompt,
+            paper_title=paper_title,
+            arxiv_id=arxiv_id,
+            sections_block=sections_block,
         )
 
     def _assemble_sections(self, chunks: list) -> list[tuple[str | None, str]]:
-        from collections import defaultdict
-
-        def get_chunk_index(c):
-            return c["chunk_index"] if isinstance(c, dict) else c.metadata.chunk_index
-
-        def get_section_title(c):
-            return c.get("section_title") if isinstance(c, dict) else c.metadata.section_title
-
-        def get_text(c):
-            return c.get("text", c.get("chunk_text", "")) if isinstance(c, dict) else c.text
-
-        sorted_chunks = sorted(chunks, key=get_chunk_index)
-
         section_order: list[str] = []
         section_texts: dict[str, list[str]] = defaultdict(list)
+        # Joined length of each section (text lengths plus one separator per chunk, minus one)
+        section_lens: dict[str, int] = defaultdict(lambda: -1)
+        skip_sections = self._SKIP_SECTIONS
 
-        for chunk in sorted_chunks:
-            section = (get_section_title(chunk) or "").strip()
-            if section.lower() in self._SKIP_SECTIONS:
+        for _, section, text in sorted(_project_chunks(chunks), key=itemgetter(0)):
+            if section.lower() in skip_sections:
                 continue
             key = section or "_unknown"
             if key not in section_texts:
                 section_order.append(key)
-            section_texts[key].append(get_text(chunk))
+            section_texts[key].append(text)
+            section_lens[key] += len(text) + 1
 
         sections: list[tuple[str | None, str]] = []
         total_chars = 0
 
         for key in section_order:
-            text = " ".join(section_texts[key])
-            if total_chars + len(text) > self._max_chars:
+            if total_chars + section_lens[key] > self._max_chars:
+                text = " ".join(section_texts[key])
                 remaining = self._max_chars - total_chars
                 if remaining > 200:
                     text = text[:remaining] + "..."
                     sections.append((key if key != "_unknown" else None, text))
                 break
-            sections.append((key if key != "_unknown" else None, text))
-            total_chars += len(text)
+            sections.append((key if key != "_unknown" else None, " ".join(section_texts[key])))
+            total_chars += section_lens[key]
 
         return sections
 
@@ -209,11 +210,10 @@ class ResponseParser:
             Dictionary with parsed response
         """
         try:
-            # Try to parse as JSON and validate with Pydantic
-            parsed_json = json.loads(response)
-            validated_response = RAGResponse(**parsed_json)
-            return validated_response.model_dump()
-        except (json.JSONDecodeError, ValidationError):
+            # Parse and validate in a single pass inside pydantic-core (no intermediate dict)
+            return RAGResponse.model_validate_json(response).model_dump()
+        except ValidationError:
+            # Invalid JSON is reported as a ValidationError too
             # Fallback: try to extract JSON from the response
             return ResponseParser._extract_json_fallback(response)
 
@@ -227,15 +227,13 @@ class ResponseParser:
         Returns:
             Dictionary with extracted content or fallback
         """
-        # Try to find JSON in the response
-        json_match = re.search(r"\{.*\}", response, re.DOTALL)
-        if json_match:
+        # Try to find JSON in the response; if it spans the whole text, the caller already rejected it
+        json_match = _JSON_BLOCK_RE.search(response)
+        if json_match and json_match.span() != (0, len(response)):
             try:
-                parsed = json.loads(json_match.group())
                 # Validate with Pydantic, using defaults for missing fields
-                validated = RAGResponse(**parsed)
-                return validated.model_dump()
-            except (json.JSONDecodeError, ValidationError):
+                return RAGResponse.model_validate_json(json_match.group()).model_dump()
+            except ValidationError:
                 pass
 
         # Final fallback: return response as plain text
@@ -262,6 +260,17 @@ class FlashcardPromptBuilder:
         "disclosure",
     }
 
+    # Built in one .format call; substituted values may contain braces (the system prompt's JSON example)
+    _TEMPLATE = (
+        "{system_prompt}\n\n"
+        "Paper Title: {paper_title}\n\n"
+        "Abstract: {paper_abstract}\n\n"
+        "Paper Content:\n{sections_block}\n\n"
+        "{topics_line}"
+        "Generate exactly {num_cards} study flashcards covering the paper's key concepts.\n\n"
+        "Output the JSON now:"
+    )
+
     def __init__(self, max_chars: int = 32_000):
         self._max_chars = max_chars
         self.prompts_dir = Path(__file__).parent / "prompts"
@@ -269,11 +278,11 @@ class FlashcardPromptBuilder:
 
     def _load_system_prompt(self) -> str:
         """Load the system prompt from the text file."""
-        prompt_file = self.prompts_dir / "flashcard.txt"
-        if not prompt_file.exists():
+        prompt = _read_prompt_file(self.prompts_dir / "flashcard.txt")
+        if prompt is None:
             # Fallback to default prompt
             return self._get_default_prompt()
-        return prompt_file.read_text().strip()
+        return prompt
 
     def _get_default_prompt(self) -> str:
         """Default flashcard generation prompt."""
@@ -325,18 +334,14 @@ Output ONLY valid JSON (no markdown, no preamble):
         sections = self._assemble_sections(chunks)
         sections_block = "\n\n".join(f"### {title or 'General'}\n{text}" for title, text in sections)
 
-        prompt = f"{self.system_prompt}\n\n"
-        prompt += f"Paper Title: {paper_title}\n\n"
-        prompt += f"Abstract: {paper_abstract}\n\n"
-        prompt += f"Paper Content:\n{sections_block}\n\n"
-
-        if topics:
-            prompt += f"Focus on these topics: {', '.join(topics)}\n\n"
-
-        prompt += f"Generate exactly {num_cards} study flashcards covering the paper's key concepts.\n\n"
-        prompt += "Output the JSON now:"
-
-        return prompt
+        return self._TEMPLATE.format(
+            system_prompt=self.system_prompt,
+            paper_title=paper_title,
+            paper_abstract=paper_abstract,
+            sections_block=sections_block,
+            topics_line=f"Focus on these topics: {', '.join(topics)}\n\n" if topics else "",
+            num_cards=num_cards,
+        )
 
     def _assemble_sections(self, chunks: list) -> list[tuple[str | None, str]]:
         """
@@ -344,42 +349,33 @@ Output ONLY valid JSON (no markdown, no preamble):
 
         Reuses the same logic as MindMapPromptBuilder.
         """
-
-        def get_chunk_index(c):
-            return c["chunk_index"] if isinstance(c, dict) else c.metadata.chunk_index
-
-        def get_section_title(c):
-            return c.get("section_title") if isinstance(c, dict) else c.metadata.section_title
-
-        def get_text(c):
-            return c.get("text", c.get("chunk_text", "")) if isinstance(c, dict) else c.text
-
-        sorted_chunks = sorted(chunks, key=get_chunk_index)
-
         section_order: list[str] = []
         section_texts: dict[str, list[str]] = defaultdict(list)
+        # Joined length of each section (text lengths plus one separator per chunk, minus one)
+        section_lens: dict[str, int] = defaultdict(lambda: -1)
+        skip_sections = self._SKIP_SECTIONS
 
-        for chunk in sorted_chunks:
-            section = (get_section_title(chunk) or "").strip()
-            if section.lower() in self._SKIP_SECTIONS:
+        for _, section, text in sorted(_project_chunks(chunks), key=itemgetter(0)):
+            if section.lower() in skip_sections:
                 continue
             key = section or "_unknown"
             if key not in section_texts:
                 section_order.append(key)
-            section_texts[key].append(get_text(chunk))
+            section_texts[key].append(text)
+            section_lens[key] += len(text) + 1
 
         sections: list[tuple[str | None, str]] = []
         total_chars = 0
 
         for key in section_order:
-            text = " ".join(section_texts[key])
-            if total_chars + len(text) > self._max_chars:
+            if total_chars + section_lens[key] > self._max_chars:
+                text = " ".join(section_texts[key])
                 remaining = self._max_chars - total_chars
                 if remaining > 200:
                     text = text[:remaining] + "..."
                     sections.append((key if key != "_unknown" else None, text))
                 break
-            sections.append((key if key != "_unknown" else None, text))
-            total_chars += len(text)
+            sections.append((key if key != "_unknown" else None, " ".join(section_texts[key])))
+            total_chars += section_lens[key]
 
         return sections
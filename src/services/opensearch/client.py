@@ -1,16 +1,22 @@
 """Unified OpenSearch client supporting both simple BM25 and hybrid search."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from opensearchpy import OpenSearch
 from src.config import Settings
 
 from .index_config_hybrid import ARXIV_PAPERS_CHUNKS_MAPPING, HYBRID_RRF_PIPELINE
 from .query_builder import QueryBuilder
+from .serializer import OrjsonSerializer
 
 logger = logging.getLogger(__name__)
 
+# Bulk indexing limits for the _bulk endpoint
+BULK_CHUNK_SIZE = 500
+BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+BULK_REQUEST_TIMEOUT = 60
+
 
 class OpenSearchClient:
     """OpenSearch client supporting BM25 and hybrid search with native RRF."""
@@ -25,8 +31,12 @@ class OpenSearchClient:
             use_ssl=False,
             verify_certs=False,
             ssl_show_warn=False,
+            serializer=OrjsonSerializer(),
         )
 
+        # Set once setup_indices has verified the index and pipeline exist
+        self._index_ready = False
+
         logger.info(f"OpenSearch client initialized with host: {host}")
 
     def health_check(self) -> bool:
@@ -64,6 +74,7 @@ class OpenSearchClient:
         results = {}
         results["hybrid_index"] = self._create_hybrid_index(force)
         results["rrf_pipeline"] = self._create_rrf_pipeline(force)
+        self._index_ready = True
         return results
 
     def _create_hybrid_index(self, force: bool = False) -> bool:
@@ -198,7 +209,7 @@ class OpenSearchClient:
         """
         try:
             # If no embedding provided or hybrid disabled, use BM25 only
-            if not query_embedding or not use_hybrid:
+            if query_embedding is None or not use_hybrid:
                 return self._search_bm25_only(query=query, size=size, from_=from_, categories=categories, latest=latest)
 
             # Use native OpenSearch hybrid search with RRF pipeline
@@ -316,27 +327,50 @@ class OpenSearchClient:
             logger.error(f"Error indexing chunk: {e}")
             return False
 
-    def bulk_index_chunks(self, chunks: List[Dict[str, Any]]) -> Dict[str, int]:
+    def bulk_index_chunks(self, chunks: Iterable[Dict[str, Any]], refresh: bool = True) -> Dict[str, int]:
         """Bulk index multiple chunks with embeddings.
 
-        :param chunks: List of dicts with 'chunk_data' and 'embedding'
+        Actions are streamed to the ``_bulk`` endpoint in batches of up to
+        ``BULK_CHUNK_SIZE`` documents, so memory stays bounded for large inputs
+        and the index is refreshed once at the end instead of per request.
+
+        :param chunks: Iterable of dicts with 'chunk_data' and 'embedding'
+        :param refresh: Refresh the index once after all batches are sent
         :returns: Statistics
         """
         from opensearchpy import helpers
 
-        try:
-            actions = []
+        def _actions():
             for chunk in chunks:
                 chunk_data = chunk["chunk_data"].copy()
                 chunk_data["embedding"] = chunk["embedding"]
 
-                action = {"_index": self.index_name, "_source": chunk_data}
-                actions.append(action)
-
-            success, failed = helpers.bulk(self.client, actions, refresh=True)
+                action = {"_op_type": "index", "_index": self.index_name, "_source": chunk_data}
+                if chunk_data.get("arxiv_id") and chunk_data.get("chunk_index") is not None:
+                    action["_id"] = f"{chunk_data['arxiv_id']}_{chunk_data['chunk_index']}"
+                yield action
 
-            logger.info(f"Bulk indexed {success} chunks, {len(failed)} failed")
-            return {"success": success, "failed": len(failed)}
+        try:
+            success, failed = 0, 0
+            for ok, item in helpers.streaming_bulk(
+                self.client,
+                _actions(),
+                chunk_size=BULK_CHUNK_SIZE,
+                max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+                request_timeout=BULK_REQUEST_TIMEOUT,
+                raise_on_error=False,
+            ):
+                if ok:
+                    success += 1
+                else:
+                    failed += 1
+                    logger.warning(f"Failed to index chunk: {item}")
+
+            if refresh and success:
+                self.client.indices.refresh(index=self.index_name)
+
+            logger.info(f"Bulk indexed {success} chunks, {failed} failed")
+            return {"success": success, "failed": failed}
 
         except Exception as e:
             logger.error(f"Bulk chunk indexing error: {e}")
@@ -96,6 +96,14 @@ class DoclingParser:
 
     async def parse_pdf(self, pdf_path: Path) -> Optional[PdfContent]:
         """Parse PDF using Docling parser.
+
+        :param pdf_path: Path to PDF file
+        :returns: PdfContent object or None if parsing failed
+        """
+        return self.parse_pdf_sync(pdf_path)
+
+    def parse_pdf_sync(self, pdf_path: Path) -> Optional[PdfContent]:
+        """Parse PDF using Docling parser, blocking the calling thread.
         Limited to 20 pages to avoid memory issues with large papers.
 
         :param pdf_path: Path to PDF file
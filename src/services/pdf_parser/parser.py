@@ -1,6 +1,12 @@
+import atexit
 import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from src.exceptions import PDFParsingException, PDFValidationError
 from src.schemas.pdf_parser.models import PdfContent
@@ -23,6 +29,12 @@ class PDFParserService:
             do_ocr: Enable OCR for scanned PDFs (default: False, very slow)
             do_table_structure: Extract table structures (default: True)
         """
+        self.options = {
+            "max_pages": max_pages,
+            "max_file_size_mb": max_file_size_mb,
+            "do_ocr": do_ocr,
+            "do_table_structure": do_table_structure,
+        }
         self.docling_parser = DoclingParser(
             max_pages=max_pages, max_file_size_mb=max_file_size_mb, do_ocr=do_ocr, do_table_structure=do_table_structure
         )
@@ -30,6 +42,14 @@ class PDFParserService:
     async def parse_pdf(self, pdf_path: Path) -> Optional[PdfContent]:
         """Parse PDF using Docling parser only.
 
+        :param pdf_path: Path to PDF file
+        :returns: PdfContent object or None if parsing failed
+        """
+        return self.parse_pdf_sync(pdf_path)
+
+    def parse_pdf_sync(self, pdf_path: Path) -> Optional[PdfContent]:
+        """Parse PDF using Docling parser only, blocking the calling thread.
+
         :param pdf_path: Path to PDF file
         :returns: PdfContent object or None if parsing failed
         """
@@ -39,7 +59,7 @@ class PDFParserService:
             raise PDFValidationError(f"PDF file not found: {pdf_path}")
 
         try:
-            result = await self.docling_parser.parse_pdf(pdf_path)
+            result = self.docling_parser.parse_pdf_sync(pdf_path)
             if result:
                 logger.info(f"Parsed {pdf_path.name}")
                 return result
@@ -55,3 +75,74 @@ class PDFParserService:
             logger.error(f"Docling parsing error for {pdf_path.name}: {e}")
             raise PDFParsingException(
                 f"Docling parsing error for {pdf_path.name}: {e}")
+
+
+@lru_cache(maxsize=1)
+def _get_worker_parser(max_pages: int, max_file_size_mb: int, do_ocr: bool, do_table_structure: bool) -> PDFParserService:
+    """Create the parser once per worker process so Docling models load only once."""
+    return PDFParserService(
+        max_pages=max_pages, max_file_size_mb=max_file_size_mb, do_ocr=do_ocr, do_table_structure=do_table_structure
+    )
+
+
+def _init_parse_worker(parser_options: Dict[str, Any]) -> None:
+    """Initializer for PDF parse worker processes: load Docling once, up front."""
+    _get_worker_parser(**parser_options)
+
+
+_parse_executors: Dict[int, ProcessPoolExecutor] = {}
+_parse_executor_lock = threading.Lock()
+
+
+def get_parse_executor(max_workers: int, parser_options: Dict[str, Any]) -> ProcessPoolExecutor:
+    """Get the long-lived process pool used for PDF parsing.
+
+    Workers are spawned (not forked, which can hang torch) and each loads the
+    Docling converter once in its initializer, so models are not reloaded per
+    PDF or per ingestion run. One pool is kept per worker count, so a run that
+    asks for a different size never shuts down a pool another run is using.
+
+    :param max_workers: Number of worker processes
+    :param parser_options: Keyword arguments used to build each worker's PDFParserService
+    :returns: Shared ProcessPoolExecutor
+    """
+    with _parse_executor_lock:
+        executor = _parse_executors.get(max_workers)
+        if executor is None:
+            # Inherited by spawned workers: one OpenMP/BLAS thread each so parallel
+            # workers do not oversubscribe the CPU
+            os.environ.setdefault("OMP_NUM_THREADS", "1")
+            os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_parse_worker,
+                initargs=(parser_options,),
+            )
+            _parse_executors[max_workers] = executor
+            logger.info(f"Started PDF parse pool with {max_workers} workers")
+        return executor
+
+
+def shutdown_parse_executor() -> None:
+    """Shut down the shared PDF parse pools, if any were started."""
+    with _parse_executor_lock:
+        for executor in _parse_executors.values():
+            executor.shutdown(wait=True)
+        _parse_executors.clear()
+
+
+atexit.register(shutdown_parse_executor)
+
+
+def parse_pdf_in_worker(pdf_path: Path, parser_options: Dict[str, Any]) -> Optional[PdfContent]:
+    """Parse a PDF inside a worker process.
+
+    Module-level so it can be pickled by ``ProcessPoolExecutor``.
+
+    :param pdf_path: Path to PDF file
+    :param parser_options: Keyword arguments used to build the worker's PDFParserService
+    :returns: PdfContent object or None if parsing failed
+    """
+    return _get_worker_parser(**parser_options).parse_pdf_sync(pdf_path)
@@ -60,14 +60,9 @@ class FlashcardCache:
         # Parse cache entry
         entry = FlashcardSetCacheEntry.model_validate_json(raw)
 
-        # Increment hit count without resetting TTL
+        # Increment hit count without resetting TTL; XX skips the write if the entry expired meanwhile
         entry.hit_count += 1
-        ttl = await self._redis.ttl(key)
-
-        # Default TTL from settings
-        default_ttl = getattr(settings, "redis_flashcard_ttl_seconds", 86400)  # 24h default
-
-        await self._redis.set(key, entry.model_dump_json(), ex=ttl if ttl > 0 else default_ttl)
+        await self._redis.set(key, entry.model_dump_json(), keepttl=True, xx=True)
 
         return entry.flashcard_set
 
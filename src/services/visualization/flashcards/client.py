@@ -215,11 +215,11 @@ class FlashcardService:
         # Get all flashcards
         flashcard_models = self._repo.get_by_paper_id(paper_id)
 
-        # Convert DB models to Pydantic schema
+        # Convert DB models to Pydantic schema; rows come from our own table, so skip validation
         from src.schemas.visualization.flashcards import Flashcard
 
         flashcards = [
-            Flashcard(
+            Flashcard.model_construct(
                 id=fc.id,
                 paper_id=str(fc.paper_id),
                 front=fc.front,
@@ -273,7 +273,7 @@ class FlashcardService:
         ttl_days = int(ttl_delta.total_seconds() / 86400)
 
         # Upsert flashcard set (replaces old if exists)
-        # Repository already calls session.refresh(), so models have database IDs
+        # The repository inserts with RETURNING, so models already have database IDs
         flashcard_models, metadata_model = self._repo.upsert_flashcard_set(
             paper_id=flashcard_set.paper_id,
             arxiv_id=flashcard_set.arxiv_id,
@@ -286,7 +286,7 @@ class FlashcardService:
         from src.schemas.visualization.flashcards import Flashcard
 
         flashcards_with_ids = [
-            Flashcard(
+            Flashcard.model_construct(
                 id=fc.id,
                 paper_id=str(fc.paper_id),
                 front=fc.front,
@@ -7,11 +7,11 @@ Follows the same pattern as MindMapGenerator.
 Location: src/services/visualization/flashcards/generator.py
 """
 
-import json
 import logging
 from datetime import datetime, timezone
 from typing import List, Optional
 
+import orjson
 from src.config import get_settings
 from src.exceptions import OllamaConnectionError, OllamaException, OllamaTimeoutError
 from src.schemas.visualization.flashcards import (
@@ -74,7 +74,7 @@ class FlashcardGenerator:
 
         try:
             # Call LLM to generate flashcards
-            result = self._client.generate_flashcards(
+            result = await self._client.generate_flashcards(
                 paper_title=paper_title,
                 paper_abstract=paper_abstract,
                 chunks=chunks,
@@ -135,8 +135,8 @@ class FlashcardGenerator:
             cleaned = "\n".join(lines[1:-1]).strip()
 
         try:
-            data = json.loads(cleaned)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(cleaned)
+        except orjson.JSONDecodeError as e:
             logger.error("Invalid JSON from LLM", extra={"preview": cleaned[:300]})
             raise FlashcardGenerationError(f"LLM returned invalid JSON: {e}") from e
 
@@ -1,5 +1,6 @@
 import json
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
 from redis.asyncio import Redis
 from src.schemas.visualization.mindmaps import MindMap, MindMapCacheEntry, MindMapCacheStatus
 from src.config import get_settings
@@ -8,67 +9,107 @@ settings = get_settings()
 
 CACHE_KEY_PREFIX = "mindmap"
 
+# The version only changes on redeploy, so the full prefix is fixed for the life of the process
+_KEY_PREFIX = f"{CACHE_KEY_PREFIX}:v{settings.redis_mindmap_cache_version}:"
+
 
 def _cache_key(paper_id: str) -> str:
-    return f"{CACHE_KEY_PREFIX}:v{settings.redis_mindmap_cache_version}:{paper_id}"
+    return _KEY_PREFIX + paper_id
+
+
+def _entry_json(mindmap: MindMap, cached_at: int, expires_at: int) -> str:
+    """
+    Serialize a cache entry in the MindMapCacheEntry layout.
+
+    The mind map is dumped once and the small envelope is spliced around it, instead of
+    building and validating a MindMapCacheEntry just to serialize it again. Fields still at their
+    default (empty descriptions, leaf children lists) are omitted; load_trusted fills them back in.
+    """
+    return (
+        f'{{"mindmap":{mindmap.model_dump_json(exclude_defaults=True)},'
+        f'"cache_version":{settings.redis_mindmap_cache_version},"hit_count":0,'
+        f'"cached_at":{cached_at},"expires_at":{expires_at}}}'
+    )
+
+
+# Meta hash fields read by status(); HMGET returns them positionally, None where missing
+_STATUS_FIELDS = ("hit_count", "cached_at", "expires_at")
+
+
+def _meta_key(paper_id: str) -> str:
+    # Sibling hash for counters, so a hit does not rewrite the cached mind map JSON
+    return _KEY_PREFIX + paper_id + ":meta"
+
+
+# Read the body and bump the hit count atomically; a miss (or an entry without meta) creates no counter
+_GET_SCRIPT = """
+local body = redis.call('GET', KEYS[1])
+if body and redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('HINCRBY', KEYS[2], 'hit_count', 1)
+end
+return body
+"""
+
+# Write the body only if absent (first writer wins) and initialise its meta hash in the same step
+_SET_SCRIPT = """
+if not redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2], 'NX') then
+    return 0
+end
+redis.call('HSET', KEYS[2], 'hit_count', 0, 'cached_at', ARGV[3], 'expires_at', ARGV[4])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return 1
+"""
 
 
 class MindMapCache:
     def __init__(self, redis_client: Redis):
         self._redis = redis_client
+        self._get_script = redis_client.register_script(_GET_SCRIPT)
+        self._set_script = redis_client.register_script(_SET_SCRIPT)
 
     async def get(self, paper_id: str) -> MindMap | None:
-        key = _cache_key(paper_id)
-        raw = await self._redis.get(key)
+        # One round trip; HINCRBY keeps the TTL set by set()
+        raw = await self._get_script(keys=[_cache_key(paper_id), _meta_key(paper_id)])
 
         if raw is None:
             return None
 
-        entry = MindMapCacheEntry.model_validate_json(raw)
-
-        # increment hit count without resetting TTL
-        entry.hit_count += 1
-        ttl = await self._redis.ttl(key)
-        await self._redis.set(key, entry.model_dump_json(), ex=ttl if ttl > 0 else settings.redis_mindmap_ttl_seconds)
+        # Entries are written by set() below, so they are trusted and need no re-validation
+        return MindMapCacheEntry.load_trusted(raw).mindmap
 
-        return entry.mindmap
+    async def set(self, mindmap: MindMap) -> bool:
+        """Cache a mind map unless another worker already did; returns whether this write landed."""
+        now = int(time.time())
+        expires_at = now + settings.redis_mindmap_ttl_seconds
 
-    async def set(self, mindmap: MindMap) -> None:
-        key = _cache_key(mindmap.paper_id)
-        now = datetime.now(timezone.utc)
-
-        entry = MindMapCacheEntry(
-            mindmap=mindmap,
-            cache_version=settings.redis_mindmap_cache_version,
-            hit_count=0,
-            cached_at=now,
-            expires_at=now + timedelta(seconds=settings.redis_mindmap_ttl_seconds),
-        )
-
-        await self._redis.set(
-            key,
-            entry.model_dump_json(),
-            ex=settings.redis_mindmap_ttl_seconds,
+        written = await self._set_script(
+            keys=[_cache_key(mindmap.paper_id), _meta_key(mindmap.paper_id)],
+            args=[_entry_json(mindmap, now, expires_at), settings.redis_mindmap_ttl_seconds, now, expires_at],
         )
+        return bool(written)
 
     async def invalidate(self, paper_id: str) -> None:
-        await self._redis.delete(_cache_key(paper_id))
+        await self._redis.delete(_cache_key(paper_id), _meta_key(paper_id))
 
     async def status(self, paper_id: str) -> MindMapCacheStatus:
         key = _cache_key(paper_id)
-        raw = await self._redis.get(key)
 
-        if raw is None:
-            return MindMapCacheStatus(paper_id=paper_id, is_cached=False)
+        # Status only needs the counters, so the mind map body is never fetched or parsed
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.exists(key)
+            pipe.hmget(_meta_key(paper_id), _STATUS_FIELDS)
+            pipe.ttl(key)
+            exists, meta, ttl = await pipe.execute()
 
-        entry = MindMapCacheEntry.model_validate_json(raw)
-        ttl = await self._redis.ttl(key)
+        if not exists:
+            return MindMapCacheStatus(paper_id=paper_id, is_cached=False)
 
+        hit_count, cached_at, expires_at = meta
         return MindMapCacheStatus(
             paper_id=paper_id,
             is_cached=True,
-            hit_count=entry.hit_count,
-            cached_at=entry.cached_at,
-            expires_at=entry.expires_at,
+            hit_count=int(hit_count or 0),
+            cached_at=datetime.fromtimestamp(int(cached_at), timezone.utc) if cached_at is not None else None,
+            expires_at=datetime.fromtimestamp(int(expires_at), timezone.utc) if expires_at is not None else None,
             ttl_seconds=ttl if ttl > 0 else None,
         )
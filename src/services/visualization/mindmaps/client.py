@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from src.schemas.visualization.mindmaps import MindMap, MindMapCacheStatus
 from src.services.visualization.mindmaps.generator import MindMapGenerator, MindMapGenerationError
@@ -10,6 +11,11 @@ class MindMapService:
     def __init__(self, generator: MindMapGenerator, cache: MindMapCache):
         self._generator = generator
         self._cache = cache
+        # One generation task per paper; concurrent misses await it instead of calling the LLM again.
+        # The entry stays until the cache write lands, so a miss in that window reuses the result.
+        self._inflight: dict[str, asyncio.Task[MindMap]] = {}
+        # Background cache writes per paper; held so they are not garbage collected and invalidate() can wait on them
+        self._pending_writes: dict[str, asyncio.Task[bool]] = {}
 
     async def get_or_generate(
         self,
@@ -24,8 +30,19 @@ class MindMapService:
             logger.info("Mind map cache hit", extra={"paper_id": paper_id})
             return cached
 
-        logger.info("Mind map cache miss — generating", extra={"paper_id": paper_id})
+        task = self._inflight.get(paper_id)
+        if task is None:
+            logger.info("Mind map cache miss — generating", extra={"paper_id": paper_id})
+            task = asyncio.create_task(self._generate_and_cache(paper_id, arxiv_id, paper_title, chunks))
+            self._inflight[paper_id] = task
+            task.add_done_callback(lambda t: self._on_generation_done(t, paper_id))
+        else:
+            logger.info("Mind map generation already in flight — waiting", extra={"paper_id": paper_id})
 
+        # Shield so a disconnecting caller does not cancel the generation other callers are waiting on
+        return await asyncio.shield(task)
+
+    async def _generate_and_cache(self, paper_id: str, arxiv_id: str, paper_title: str, chunks: list) -> MindMap:
         # 2. Generate
         mindmap = await self._generator.generate(
             paper_id=paper_id,
@@ -37,13 +54,41 @@ class MindMapService:
         # Override title from paper record (more reliable than chunk inference)
         mindmap.paper_title = paper_title
 
-        # 3. Cache and return
-        await self._cache.set(mindmap)
-        logger.info("Mind map generated and cached", extra={"paper_id": paper_id})
+        # 3. Cache in the background and return; the response does not depend on the write
+        generation = asyncio.current_task()
+        write = asyncio.create_task(self._cache.set(mindmap))
+        self._pending_writes[paper_id] = write
+        write.add_done_callback(lambda t: self._on_cache_write_done(t, paper_id, generation))
 
         return mindmap
 
+    def _on_generation_done(self, task: asyncio.Task[MindMap], paper_id: str) -> None:
+        # Successful generations are released by _on_cache_write_done once the result is in Redis
+        if (task.cancelled() or task.exception() is not None) and self._inflight.get(paper_id) is task:
+            del self._inflight[paper_id]
+
+    def _on_cache_write_done(self, task: asyncio.Task[bool], paper_id: str, generation: asyncio.Task | None) -> None:
+        if self._pending_writes.get(paper_id) is task:
+            del self._pending_writes[paper_id]
+        if self._inflight.get(paper_id) is generation:
+            del self._inflight[paper_id]
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.warning(f"Mind map cache write failed: {task.exception()}", extra={"paper_id": paper_id})
+        elif task.result():
+            logger.info("Mind map generated and cached", extra={"paper_id": paper_id})
+        else:
+            logger.info("Mind map already cached by another worker", extra={"paper_id": paper_id})
+
     async def invalidate(self, paper_id: str) -> None:
+        # Let a pending write land first, otherwise it would restore the entry we are about to delete
+        write = self._pending_writes.get(paper_id)
+        if write is not None:
+            await asyncio.wait([write])
+        generation = self._inflight.get(paper_id)
+        if generation is not None and generation.done():
+            del self._inflight[paper_id]
         await self._cache.invalidate(paper_id)
         logger.info("Mind map cache invalidated", extra={"paper_id": paper_id})
 
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from src.services.visualization.mindmaps.generator import MindMapGenerator
 from src.services.visualization.mindmaps.cache import MindMapCache
 from src.services.visualization.mindmaps.client import MindMapService
@@ -5,7 +7,9 @@ from src.services.nvidia.factory import make_nvidia_client
 from src.db.redis.redis import get_redis_client
 
 
+@lru_cache(maxsize=1)
 def get_mindmap_service() -> MindMapService:
+    """Singleton service; the in-flight generation map must be shared by every caller."""
     generator = MindMapGenerator(nvidia_client=make_nvidia_client())
     cache = MindMapCache(redis_client=get_redis_client())
     return MindMapService(generator=generator, cache=cache)
@@ -1,7 +1,8 @@
-import json
+import asyncio
 import logging
 from datetime import datetime, timezone
 
+from pydantic import BaseModel, ValidationError
 from src.schemas.visualization.mindmaps import MindMap, MindMapNode
 from src.services.nvidia.client import NvidiaClient
 from src.config import get_settings
@@ -15,6 +16,14 @@ class MindMapGenerationError(Exception):
     pass
 
 
+class _LLMMindMap(BaseModel):
+    """Shape of the LLM's mind map JSON, so parsing and validation happen in one pydantic-core pass."""
+
+    root: MindMapNode
+    paper_title: str | None = None
+    sections_covered: list[str] = []
+
+
 class MindMapGenerator:
     def __init__(self, nvidia_client: NvidiaClient):
         self._client = nvidia_client
@@ -26,7 +35,7 @@ class MindMapGenerator:
         logger.info("Generating mind map", extra={"paper_id": paper_id, "chunk_count": len(chunks)})
 
         try:
-            result = self._client.generate_mindmap(
+            result = await self._client.generate_mindmap(
                 paper_title=paper_title,
                 arxiv_id=arxiv_id,
                 chunks=chunks,
@@ -38,31 +47,32 @@ class MindMapGenerator:
         except OllamaException as e:
             raise MindMapGenerationError(f"LLM error: {e}") from e
 
-        return self._parse(result["raw"], paper_id, arxiv_id, paper_title)
+        # Parsing and validating a large tree is CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(self._parse, result["raw"], paper_id, arxiv_id, paper_title)
 
     def _parse(self, raw: str, paper_id: str, arxiv_id: str, paper_title: str) -> MindMap:
         cleaned = raw.strip()
         if cleaned.startswith("```"):
-            lines = cleaned.splitlines()
-            cleaned = "\n".join(lines[1:-1]).strip()
-
-        try:
-            data = json.loads(cleaned)
-        except json.JSONDecodeError as e:
-            logger.error("Invalid JSON from LLM", extra={"preview": cleaned[:300]})
-            raise MindMapGenerationError(f"LLM returned invalid JSON: {e}") from e
+            # Slice between the opening fence line and the closing fence without splitting into lines
+            start = cleaned.find("\n") + 1
+            end = cleaned.rfind("```")
+            cleaned = cleaned[start : end if end >= start else len(cleaned)].strip()
 
         try:
-            root_node = MindMapNode.model_validate(data["root"])
-        except Exception as e:
+            parsed = _LLMMindMap.model_validate_json(cleaned)
+        except ValidationError as e:
+            # Malformed JSON surfaces as a json_invalid error from the same call
+            if any(err["type"] == "json_invalid" for err in e.errors()):
+                logger.error("Invalid JSON from LLM", extra={"preview": cleaned[:300]})
+                raise MindMapGenerationError(f"LLM returned invalid JSON: {e}") from e
             raise MindMapGenerationError(f"Mind map validation failed: {e}") from e
 
         return MindMap(
             paper_id=paper_id,
             arxiv_id=arxiv_id,
-            paper_title=data.get("paper_title", paper_title),
-            root=root_node,
-            sections_covered=data.get("sections_covered", []),
+            paper_title=parsed.paper_title if parsed.paper_title is not None else paper_title,
+            root=parsed.root,
+            sections_covered=parsed.sections_covered,
             generated_at=datetime.now(timezone.utc),
             model_used=settings.nvidia_model if hasattr(settings, "nvidia_model") else "meta/llama-3.3-70b-instruct",
         )
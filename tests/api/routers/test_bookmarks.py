@@ -0,0 +1,170 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.dependencies import get_db_session, get_redis_client
+from src.routers import bookmarks
+
+SESSION_ID = "s" * 43
+
+
+class FakeRedis:
+    """In-memory stand-in for the handful of Redis commands the bookmarks router uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def expire(self, key, ttl):
+        return key in self.data
+
+    async def sadd(self, key, member):
+        members = self.data.setdefault(key, set())
+        added = member not in members
+        members.add(member)
+        return int(added)
+
+    async def scard(self, key):
+        return len(self.data.get(key, ()))
+
+    async def srem(self, key, member):
+        members = self.data.get(key, set())
+        removed = member in members
+        members.discard(member)
+        return int(removed)
+
+    async def smembers(self, key):
+        return set(self.data.get(key, ()))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+def _summary(arxiv_id: str):
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        id=uuid4(),
+        arxiv_id=arxiv_id,
+        title=f"Paper {arxiv_id}",
+        authors=["Ada Lovelace"],
+        abstract="An abstract.",
+        categories=["cs.AI"],
+        published_date=now,
+        pdf_url=f"https://arxiv.org/pdf/{arxiv_id}",
+        parser_used=None,
+        pdf_processed=False,
+        pdf_processing_date=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+async def client(redis):
+    """Client for an app with just the bookmarks router; Redis and the database are faked."""
+    app = FastAPI()
+    app.include_router(bookmarks.router, prefix="/api/v1")
+    app.dependency_overrides[get_redis_client] = lambda: redis
+    app.dependency_overrides[get_db_session] = lambda: MagicMock()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def headers(redis):
+    redis.data[bookmarks._session_key(SESSION_ID)] = 1
+    return {bookmarks.SESSION_HEADER: SESSION_ID}
+
+
+async def test_unknown_session_is_rejected(client):
+    response = await client.put("/api/v1/bookmarks/2401.00001", headers={bookmarks.SESSION_HEADER: SESSION_ID})
+
+    assert response.status_code == 401
+
+
+async def test_issued_session_can_bookmark(client, redis):
+    session_id = (await client.post("/api/v1/bookmarks/session")).json()["session_id"]
+
+    response = await client.put("/api/v1/bookmarks/2401.00001", headers={bookmarks.SESSION_HEADER: session_id})
+
+    assert response.status_code == 204
+    assert redis.data[bookmarks._bookmarks_key(session_id)] == {"2401.00001"}
+
+
+async def test_invalid_arxiv_id_is_rejected(client, redis, headers):
+    response = await client.put("/api/v1/bookmarks/not-an-id", headers=headers)
+
+    assert response.status_code == 422
+    assert bookmarks._bookmarks_key(SESSION_ID) not in redis.data
+
+
+async def test_limit_reached_rolls_back_the_add(client, redis, headers, monkeypatch):
+    monkeypatch.setattr(bookmarks, "settings", bookmarks.settings.model_copy(update={"bookmarks_max_per_session": 1}))
+    assert (await client.put("/api/v1/bookmarks/2401.00001", headers=headers)).status_code == 204
+
+    response = await client.put("/api/v1/bookmarks/2401.00002", headers=headers)
+
+    assert response.status_code == 409
+    assert redis.data[bookmarks._bookmarks_key(SESSION_ID)] == {"2401.00001"}
+    # Re-adding an existing bookmark at the limit is not a new entry
+    assert (await client.put("/api/v1/bookmarks/2401.00001", headers=headers)).status_code == 204
+
+
+async def test_list_returns_only_stored_ids(client, redis, headers):
+    redis.data[bookmarks._bookmarks_key(SESSION_ID)] = {"2401.00001", "2401.00002"}
+
+    with patch.object(
+        bookmarks.PaperRepository, "get_by_arxiv_ids", return_value=[_summary("2401.00002"), _summary("2401.00001")]
+    ) as get_by_arxiv_ids:
+        response = await client.get("/api/v1/bookmarks", headers=headers)
+
+    assert response.status_code == 200
+    assert sorted(get_by_arxiv_ids.call_args.args[0]) == ["2401.00001", "2401.00002"]
+    assert [paper["arxiv_id"] for paper in response.json()["bookmarks"]] == ["2401.00002", "2401.00001"]
+
+
+async def test_list_without_bookmarks_skips_the_database(client, headers):
+    with patch.object(bookmarks.PaperRepository, "get_by_arxiv_ids") as get_by_arxiv_ids:
+        response = await client.get("/api/v1/bookmarks", headers=headers)
+
+    assert response.json() == {"bookmarks": []}
+    get_by_arxiv_ids.assert_not_called()
+
+
+async def test_remove_bookmark(client, redis, headers):
+    redis.data[bookmarks._bookmarks_key(SESSION_ID)] = {"2401.00001"}
+
+    response = await client.delete("/api/v1/bookmarks/2401.00001", headers=headers)
+
+    assert response.status_code == 204
+    assert redis.data[bookmarks._bookmarks_key(SESSION_ID)] == set()
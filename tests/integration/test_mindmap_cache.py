@@ -0,0 +1,117 @@
+from datetime import datetime, timezone
+
+import pytest
+from redis.asyncio import Redis
+from src.schemas.visualization.mindmaps import MindMap, MindMapNode
+from src.services.visualization.mindmaps.cache import MindMapCache, _cache_key, _meta_key, settings
+
+PAPER_ID = "paper-1"
+
+
+@pytest.fixture(scope="module")
+def redis_url():
+    """A throwaway Redis; the Lua scripts need a real server, so skip where Docker is unavailable."""
+    redis_module = pytest.importorskip("testcontainers.redis")
+    try:
+        container = redis_module.RedisContainer("redis:7-alpine").start()
+    except Exception as e:
+        pytest.skip(f"Docker is not available: {e}")
+    try:
+        yield f"redis://{container.get_container_host_ip()}:{container.get_exposed_port(6379)}/0"
+    finally:
+        container.stop()
+
+
+@pytest.fixture
+async def redis(redis_url):
+    client = Redis.from_url(redis_url, decode_responses=True)
+    await client.flushdb()
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def cache(redis):
+    return MindMapCache(redis_client=redis)
+
+
+def _mindmap(title: str = "Paper Title") -> MindMap:
+    return MindMap(
+        paper_id=PAPER_ID,
+        arxiv_id="2401.00001",
+        paper_title=title,
+        root=MindMapNode(
+            id="root",
+            label="Root",
+            node_type="root",
+            importance="primary",
+            children=[MindMapNode(id="c1", label="Child", node_type="concept", importance="secondary")],
+        ),
+        sections_covered=["Introduction"],
+        generated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        model_used="test-model",
+    )
+
+
+async def test_set_writes_body_and_meta(cache, redis):
+    assert await cache.set(_mindmap()) is True
+
+    meta = await redis.hgetall(_meta_key(PAPER_ID))
+    assert meta["hit_count"] == "0"
+    assert int(meta["expires_at"]) - int(meta["cached_at"]) == settings.redis_mindmap_ttl_seconds
+    assert await redis.ttl(_cache_key(PAPER_ID)) > 0
+    assert await redis.ttl(_meta_key(PAPER_ID)) > 0
+
+
+async def test_set_is_first_writer_wins(cache):
+    assert await cache.set(_mindmap("First")) is True
+    assert await cache.set(_mindmap("Second")) is False
+
+    assert (await cache.get(PAPER_ID)).paper_title == "First"
+
+
+async def test_get_round_trips_and_counts_hits(cache, redis):
+    mindmap = _mindmap()
+    await cache.set(mindmap)
+
+    cached = await cache.get(PAPER_ID)
+    await cache.get(PAPER_ID)
+
+    assert cached.model_dump() == mindmap.model_dump()
+    assert await redis.hget(_meta_key(PAPER_ID), "hit_count") == "2"
+
+
+async def test_get_miss_creates_no_counter(cache, redis):
+    assert await cache.get(PAPER_ID) is None
+
+    assert await redis.exists(_meta_key(PAPER_ID)) == 0
+
+
+async def test_get_without_meta_does_not_recreate_it(cache, redis):
+    await cache.set(_mindmap())
+    await redis.delete(_meta_key(PAPER_ID))
+
+    assert await cache.get(PAPER_ID) is not None
+    assert await redis.exists(_meta_key(PAPER_ID)) == 0
+
+
+async def test_invalidate_removes_body_and_meta(cache, redis):
+    await cache.set(_mindmap())
+
+    await cache.invalidate(PAPER_ID)
+
+    assert await redis.exists(_cache_key(PAPER_ID), _meta_key(PAPER_ID)) == 0
+    assert await cache.set(_mindmap()) is True
+
+
+async def test_status_reports_hits_and_expiry(cache):
+    assert (await cache.status(PAPER_ID)).is_cached is False
+
+    await cache.set(_mindmap())
+    await cache.get(PAPER_ID)
+    status = await cache.status(PAPER_ID)
+
+    assert status.is_cached is True
+    assert status.hit_count == 1
+    assert status.cached_at is not None and status.expires_at > status.cached_at
+    assert status.ttl_seconds > 0
@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from src.repositories.paper import PaperRepository
+from src.schemas.arxiv.paper import PaperCreate, PaperSearchFilters
+
+
+def _paper(arxiv_id: str = "2401.00001", **fields) -> PaperCreate:
+    """Metadata-only paper, as the arXiv fetch step builds it; parsed fields are added per test."""
+    return PaperCreate(
+        arxiv_id=arxiv_id,
+        title=fields.pop("title", "A Paper"),
+        authors=["Ada Lovelace"],
+        abstract="An abstract.",
+        categories=["cs.AI"],
+        published_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        pdf_url=f"https://arxiv.org/pdf/{arxiv_id}",
+        **fields,
+    )
+
+
+def _updated_columns(stmt) -> set:
+    """Columns assigned in the ON CONFLICT DO UPDATE SET clause of a compiled upsert."""
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    set_clause = sql.split("DO UPDATE SET", 1)[1].split(" RETURNING", 1)[0]
+    return {assignment.split("=", 1)[0].strip() for assignment in set_clause.split(",")}
+
+
+@pytest.fixture
+def session():
+    return MagicMock()
+
+
+@pytest.fixture
+def repository(session):
+    return PaperRepository(session)
+
+
+def test_upsert_metadata_only_keeps_parsed_content(repository, session):
+    repository.upsert(_paper())
+
+    stmt = session.scalars.call_args.args[0]
+    updated = _updated_columns(stmt)
+    assert {"title", "abstract", "updated_at"} <= updated
+    assert not updated & {"arxiv_id", "raw_text", "sections", "references", "parser_metadata", "pdf_processed"}
+
+
+def test_upsert_with_parsed_content_overwrites_it(repository, session):
+    repository.upsert(_paper(raw_text="Full text", pdf_processed=True))
+
+    updated = _updated_columns(session.scalars.call_args.args[0])
+    assert {"raw_text", "pdf_processed"} <= updated
+
+
+def test_bulk_upsert_last_duplicate_wins(repository, session):
+    count = repository.bulk_upsert([_paper(title="First"), _paper(title="Second")])
+
+    assert count == 1
+    session.execute.assert_called_once()
+    rows = session.execute.call_args.args[1]
+    assert [row["title"] for row in rows] == ["Second"]
+
+
+def test_bulk_upsert_groups_rows_by_fields_set(repository, session):
+    count = repository.bulk_upsert([_paper("2401.00001"), _paper("2401.00002", raw_text="Full text")])
+
+    assert count == 2
+    assert session.execute.call_count == 2
+    updated_by_arxiv_id = {
+        call.args[1][0]["arxiv_id"]: _updated_columns(call.args[0]) for call in session.execute.call_args_list
+    }
+    assert "raw_text" not in updated_by_arxiv_id["2401.00001"]
+    assert "raw_text" in updated_by_arxiv_id["2401.00002"]
+
+
+def test_search_returns_page_total_from_window_count(repository, session):
+    paper = MagicMock()
+    session.execute.return_value.all.return_value = [MagicMock(Paper=paper, total=42)]
+
+    papers, total = repository.search(PaperSearchFilters(query="transformers"), limit=20, offset=0)
+
+    assert papers == [paper]
+    assert total == 42
+    session.scalar.assert_not_called()
+
+
+def test_search_counts_when_page_is_past_the_end(repository, session):
+    session.execute.return_value.all.return_value = []
+    session.scalar.return_value = 42
+
+    papers, total = repository.search(PaperSearchFilters(categories=["cs.AI"]), limit=20, offset=100)
+
+    assert papers == []
+    assert total == 42
+    session.scalar.assert_called_once()
+
+
+def test_search_empty_first_page_skips_count(repository, session):
+    session.execute.return_value.all.return_value = []
+
+    assert repository.search(PaperSearchFilters(query="nothing matches"), limit=20, offset=0) == ([], 0)
+    session.scalar.assert_not_called()
@@ -0,0 +1,160 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from src.schemas.visualization.mindmaps import MindMap, MindMapNode
+from src.services.visualization.mindmaps.client import MindMapService
+
+PAPER_ID = "paper-1"
+
+
+def _mindmap(paper_id: str = PAPER_ID) -> MindMap:
+    return MindMap(
+        paper_id=paper_id,
+        arxiv_id="2401.00001",
+        paper_title="From the LLM",
+        root=MindMapNode(id="root", label="Root", node_type="root", importance="primary"),
+        sections_covered=["Introduction"],
+        generated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        model_used="test-model",
+    )
+
+
+class FakeGenerator:
+    """Generator that blocks until released, so tests control when a generation finishes."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.error: Exception | None = None
+
+    async def generate(self, paper_id, arxiv_id, chunks, paper_title):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return _mindmap(paper_id)
+
+
+class FakeCache:
+    """Dict-backed cache whose writes block until ``write_gate`` is set."""
+
+    def __init__(self):
+        self.entries = {}
+        self.write_gate = asyncio.Event()
+        self.write_gate.set()
+
+    async def get(self, paper_id):
+        return self.entries.get(paper_id)
+
+    async def set(self, mindmap):
+        await self.write_gate.wait()
+        if mindmap.paper_id in self.entries:
+            return False
+        self.entries[mindmap.paper_id] = mindmap
+        return True
+
+    async def invalidate(self, paper_id):
+        self.entries.pop(paper_id, None)
+
+
+@pytest.fixture
+def generator():
+    return FakeGenerator()
+
+
+@pytest.fixture
+def cache():
+    return FakeCache()
+
+
+@pytest.fixture
+def service(generator, cache):
+    return MindMapService(generator=generator, cache=cache)
+
+
+def _request(service: MindMapService) -> asyncio.Task:
+    return asyncio.create_task(service.get_or_generate(PAPER_ID, "2401.00001", "Paper Title", chunks=[]))
+
+
+async def _settle():
+    """Let queued callbacks and background tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_concurrent_misses_generate_once(service, generator, cache):
+    first, second = _request(service), _request(service)
+    await _settle()
+    generator.release.set()
+
+    results = await asyncio.gather(first, second)
+
+    assert generator.calls == 1
+    assert results[0] is results[1]
+    assert results[0].paper_title == "Paper Title"
+    await _settle()
+    assert cache.entries[PAPER_ID] is results[0]
+    assert service._inflight == {}
+    assert service._pending_writes == {}
+
+
+async def test_cancelled_caller_does_not_cancel_shared_generation(service, generator):
+    first, second = _request(service), _request(service)
+    await _settle()
+
+    first.cancel()
+    await _settle()
+    generator.release.set()
+
+    assert (await second).paper_id == PAPER_ID
+    assert first.cancelled()
+    assert generator.calls == 1
+
+
+async def test_failed_generation_clears_inflight(service, generator):
+    generator.error = RuntimeError("LLM down")
+    generator.release.set()
+
+    with pytest.raises(RuntimeError):
+        await _request(service)
+    await _settle()
+
+    assert service._inflight == {}
+    # The next request starts a fresh generation instead of reusing the failed task
+    generator.error = None
+    assert (await _request(service)).paper_id == PAPER_ID
+    assert generator.calls == 2
+
+
+async def test_miss_during_pending_write_reuses_the_result(service, generator, cache):
+    cache.write_gate.clear()
+    generator.release.set()
+    first = await _request(service)
+
+    second = await _request(service)
+
+    assert second is first
+    assert generator.calls == 1
+    cache.write_gate.set()
+    await _settle()
+    assert service._inflight == {}
+
+
+async def test_invalidate_waits_for_pending_write(service, generator, cache):
+    cache.write_gate.clear()
+    generator.release.set()
+    await _request(service)
+    assert PAPER_ID in service._pending_writes
+
+    invalidate = asyncio.create_task(service.invalidate(PAPER_ID))
+    await _settle()
+    assert not invalidate.done()
+
+    cache.write_gate.set()
+    await invalidate
+
+    # The write landed first and the invalidation then removed it
+    assert PAPER_ID not in cache.entries
+    assert service._pending_writes == {}
+    assert service._inflight == {}